@@ -0,0 +1,57 @@
+"""
+Compilación anticipada (AOT) de los kernels de indicadores del Proyecto Phoenix.
+
+Genera la extensión nativa core/_phoenix_kernels con los kernels de
+core/_indicators_numba ya compilados, de modo que el motor de análisis no
+tenga que compilarlos con el JIT de Numba en el primer uso. Si la extensión
+no existe, el motor recurre automáticamente a los kernels JIT.
+
+Uso:
+    python build_kernels.py
+"""
+
+import os
+
+from numba.pycc import CC
+
+from core._indicators_numba import (
+    AOT_SIGNATURES,
+    compute_all,
+    kernel_source_hash,
+    resume_all,
+    rolling_mean,
+    warmup_length,
+)
+
+
+_KERNELS = {
+    'warmup_length': warmup_length,
+    'compute_all': compute_all,
+    'resume_all': resume_all,
+    'rolling_mean': rolling_mean,
+}
+
+
+def _constant(value: int):
+    """Crea una función sin argumentos que devuelve value, para exportarla."""
+    def source_hash():
+        return value
+    return source_hash
+
+
+def build() -> None:
+    """Compila los kernels y deja la extensión junto al paquete core."""
+    cc = CC('_phoenix_kernels')
+    cc.output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'core')
+    
+    for name, signature in AOT_SIGNATURES.items():
+        cc.export(name, signature)(_KERNELS[name].py_func)
+    
+    # Huella del código de los kernels, comprobada al importar la extensión
+    cc.export('source_hash', 'i8()')(_constant(kernel_source_hash()))
+    
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
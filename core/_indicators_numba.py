@@ -0,0 +1,438 @@
+"""
+Kernels compilados con Numba para el Motor de Análisis Técnico.
+
+Este módulo contiene las rutinas numéricas de bajo nivel que calculan los
+indicadores técnicos sobre arrays NumPy. Se mantienen separadas del motor
+para que operen exclusivamente sobre memoria contigua, sin objetos de pandas.
+"""
+
+import hashlib
+import logging
+
+import numpy as np
+from numba import njit, prange
+
+
+# Posiciones del vector de estado compartido por compute_all y resume_all
+STATE_SIZE = 7
+_EMA = 0
+_EMA_FAST = 1
+_EMA_SLOW = 2
+_AVG_GAIN = 3
+_AVG_LOSS = 4
+_SIGNAL = 5
+_LAST_CLOSE = 6
+
+
+@njit(cache=True)
+def warmup_length(ema_p, rsi_p, fast, slow, signal):
+    """
+    Devuelve el número de filas necesarias para sembrar todos los indicadores.
+
+    A partir de esa fila todos los estados están en régimen estacionario y el
+    cálculo puede continuarse con resume_all.
+
+    Args:
+        ema_p: Período de la EMA
+        rsi_p: Período del RSI
+        fast: Período rápido del MACD
+        slow: Período lento del MACD
+        signal: Período de señal del MACD
+
+    Returns:
+        Índice de la primera fila en régimen estacionario
+    """
+    return max(ema_p - 1, rsi_p, slow + signal - 2) + 1
+
+
+@njit(cache=True)
+def compute_all(
+    close, ema_p, rsi_p, fast, slow, signal,
+    out_ema, out_rsi, out_macd, out_sig, out_hist, state
+):
+    """
+    Calcula EMA, RSI y MACD en una única pasada sobre el precio de cierre.
+
+    Cada valor de close se lee una sola vez y actualiza todos los estados
+    exponenciales (EMA, EMA rápida y lenta del MACD, medias de Wilder del RSI
+    y EMA de la señal). Las semillas replican las de TA-Lib: media simple del
+    primer período para cada EMA y para la señal, y media de las primeras
+    ganancias/pérdidas para el RSI.
+
+    Al terminar, state contiene el estado tras la última fila, de modo que
+    resume_all puede continuar el cálculo sobre filas nuevas. Solo es válido
+    si close tiene más de warmup_length(...) filas.
+
+    Args:
+        close: Array float64 contiguo con los precios de cierre
+        ema_p: Período de la EMA
+        rsi_p: Período del RSI
+        fast: Período rápido del MACD
+        slow: Período lento del MACD
+        signal: Período de señal del MACD
+        out_ema: Array de salida para la EMA
+        out_rsi: Array de salida para el RSI
+        out_macd: Array de salida para la línea MACD
+        out_sig: Array de salida para la línea de señal
+        out_hist: Array de salida para el histograma
+        state: Array float64 de STATE_SIZE elementos donde se escribe el estado final
+    """
+    n = close.shape[0]
+    steady = warmup_length(ema_p, rsi_p, fast, slow, signal)
+
+    # Índices en los que cada indicador queda sembrado
+    ema_seed = ema_p - 1
+    fast_from = slow - fast
+    macd_seed = slow - 1
+    sig_seed = macd_seed + signal - 1
+
+    alpha_ema = 2.0 / (ema_p + 1.0)
+    alpha_fast = 2.0 / (fast + 1.0)
+    alpha_slow = 2.0 / (slow + 1.0)
+    alpha_sig = 2.0 / (signal + 1.0)
+
+    ema = 0.0
+    ema_fast = 0.0
+    ema_slow = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    sig = 0.0
+
+    # Fase de calentamiento: siembra de todos los indicadores
+    for i in range(min(n, steady)):
+        c = close[i]
+
+        # === EMA ===
+        if i < ema_seed:
+            ema += c
+            out_ema[i] = np.nan
+        elif i == ema_seed:
+            ema = (ema + c) / ema_p
+            out_ema[i] = ema
+        else:
+            ema = (c - ema) * alpha_ema + ema
+            out_ema[i] = ema
+
+        # === RSI (suavizado de Wilder) ===
+        if i == 0:
+            out_rsi[i] = np.nan
+        else:
+            delta = c - close[i - 1]
+            gain = delta if delta > 0.0 else 0.0
+            loss = -delta if delta < 0.0 else 0.0
+
+            if i < rsi_p:
+                avg_gain += gain
+                avg_loss += loss
+                out_rsi[i] = np.nan
+            else:
+                if i == rsi_p:
+                    avg_gain = (avg_gain + gain) / rsi_p
+                    avg_loss = (avg_loss + loss) / rsi_p
+                else:
+                    avg_gain = (avg_gain * (rsi_p - 1) + gain) / rsi_p
+                    avg_loss = (avg_loss * (rsi_p - 1) + loss) / rsi_p
+
+                total = avg_gain + avg_loss
+                out_rsi[i] = 100.0 * (avg_gain / total) if total != 0.0 else 0.0
+
+        # === MACD ===
+        if i < macd_seed:
+            ema_slow += c
+            if i >= fast_from:
+                ema_fast += c
+            out_macd[i] = np.nan
+            out_sig[i] = np.nan
+            out_hist[i] = np.nan
+            continue
+
+        if i == macd_seed:
+            ema_slow = (ema_slow + c) / slow
+            ema_fast = (ema_fast + c) / fast
+        else:
+            ema_slow = (c - ema_slow) * alpha_slow + ema_slow
+            ema_fast = (c - ema_fast) * alpha_fast + ema_fast
+
+        macd = ema_fast - ema_slow
+
+        if i < sig_seed:
+            sig += macd
+            out_macd[i] = np.nan
+            out_sig[i] = np.nan
+            out_hist[i] = np.nan
+            continue
+
+        if i == sig_seed:
+            sig = (sig + macd) / signal
+        else:
+            sig = (macd - sig) * alpha_sig + sig
+
+        out_macd[i] = macd
+        out_sig[i] = sig
+        out_hist[i] = macd - sig
+
+    state[_EMA] = ema
+    state[_EMA_FAST] = ema_fast
+    state[_EMA_SLOW] = ema_slow
+    state[_AVG_GAIN] = avg_gain
+    state[_AVG_LOSS] = avg_loss
+    state[_SIGNAL] = sig
+    state[_LAST_CLOSE] = close[min(n, steady) - 1] if n > 0 else np.nan
+
+    # Régimen estacionario: mismo bucle que la continuación incremental
+    if n > steady:
+        resume_all(
+            close, steady, ema_p, rsi_p, fast, slow, signal,
+            out_ema, out_rsi, out_macd, out_sig, out_hist, state
+        )
+
+
+@njit(cache=True)
+def resume_all(
+    close, start, ema_p, rsi_p, fast, slow, signal,
+    out_ema, out_rsi, out_macd, out_sig, out_hist, state
+):
+    """
+    Continúa EMA, RSI y MACD desde un estado previo para las filas [start, n).
+
+    Aplica una iteración de régimen estacionario por fila partiendo de state,
+    que debe corresponder a la fila start-1 (producido por compute_all o por
+    una llamada anterior a resume_all). Al terminar, state se actualiza con el
+    estado tras la última fila procesada.
+
+    Args:
+        close: Array float64 contiguo con los precios de cierre
+        start: Primera fila a calcular
+        ema_p: Período de la EMA
+        rsi_p: Período del RSI
+        fast: Período rápido del MACD
+        slow: Período lento del MACD
+        signal: Período de señal del MACD
+        out_ema: Array de salida para la EMA
+        out_rsi: Array de salida para el RSI
+        out_macd: Array de salida para la línea MACD
+        out_sig: Array de salida para la línea de señal
+        out_hist: Array de salida para el histograma
+        state: Array float64 de STATE_SIZE elementos (entrada y salida)
+    """
+    n = close.shape[0]
+
+    alpha_ema = 2.0 / (ema_p + 1.0)
+    alpha_fast = 2.0 / (fast + 1.0)
+    alpha_slow = 2.0 / (slow + 1.0)
+    alpha_sig = 2.0 / (signal + 1.0)
+
+    ema = state[_EMA]
+    ema_fast = state[_EMA_FAST]
+    ema_slow = state[_EMA_SLOW]
+    avg_gain = state[_AVG_GAIN]
+    avg_loss = state[_AVG_LOSS]
+    sig = state[_SIGNAL]
+    prev_close = state[_LAST_CLOSE]
+
+    for i in range(start, n):
+        c = close[i]
+
+        ema = (c - ema) * alpha_ema + ema
+        out_ema[i] = ema
+
+        delta = c - prev_close
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        avg_gain = (avg_gain * (rsi_p - 1) + gain) / rsi_p
+        avg_loss = (avg_loss * (rsi_p - 1) + loss) / rsi_p
+        total = avg_gain + avg_loss
+        out_rsi[i] = 100.0 * (avg_gain / total) if total != 0.0 else 0.0
+
+        ema_slow = (c - ema_slow) * alpha_slow + ema_slow
+        ema_fast = (c - ema_fast) * alpha_fast + ema_fast
+        macd = ema_fast - ema_slow
+        sig = (macd - sig) * alpha_sig + sig
+        out_macd[i] = macd
+        out_sig[i] = sig
+        out_hist[i] = macd - sig
+
+        prev_close = c
+
+    state[_EMA] = ema
+    state[_EMA_FAST] = ema_fast
+    state[_EMA_SLOW] = ema_slow
+    state[_AVG_GAIN] = avg_gain
+    state[_AVG_LOSS] = avg_loss
+    state[_SIGNAL] = sig
+    state[_LAST_CLOSE] = prev_close
+
+
+@njit(cache=True)
+def rolling_mean(x, w, out):
+    """
+    Calcula la media móvil simple de ventana w con una suma acumulada.
+
+    Mantiene una única suma de la ventana: en cada paso añade el elemento
+    que entra y resta el que sale, de modo que el coste por fila es O(1).
+    Las primeras w-1 posiciones quedan como NaN, igual que pandas.
+
+    Args:
+        x: Array float64 contiguo de entrada
+        w: Tamaño de la ventana
+        out: Array de salida con la misma longitud que x
+    """
+    n = x.shape[0]
+
+    for i in range(min(w - 1, n)):
+        out[i] = np.nan
+
+    if n < w:
+        return
+
+    s = 0.0
+    for i in range(w):
+        s += x[i]
+    out[w - 1] = s / w
+
+    for i in range(w, n):
+        s += x[i] - x[i - w]
+        out[i] = s / w
+
+
+@njit(cache=True, parallel=True)
+def compute_all_batch(
+    close2d, volume2d, ema_p, rsi_p, fast, slow, signal, vol_p,
+    out_ema, out_rsi, out_macd, out_sig, out_hist, out_vol
+):
+    """
+    Calcula todos los indicadores para varios símbolos en paralelo.
+
+    Cada fila de las matrices corresponde a un símbolo; las filas son
+    independientes entre sí, por lo que se reparten entre hilos con prange
+    sin necesidad de sincronización.
+
+    Args:
+        close2d: Matriz float64 (n_símbolos, n_velas) con los cierres
+        volume2d: Matriz float64 (n_símbolos, n_velas) con los volúmenes
+        ema_p: Período de la EMA
+        rsi_p: Período del RSI
+        fast: Período rápido del MACD
+        slow: Período lento del MACD
+        signal: Período de señal del MACD
+        vol_p: Período de la media de volumen
+        out_ema: Matriz de salida para la EMA
+        out_rsi: Matriz de salida para el RSI
+        out_macd: Matriz de salida para la línea MACD
+        out_sig: Matriz de salida para la línea de señal
+        out_hist: Matriz de salida para el histograma
+        out_vol: Matriz de salida para la media de volumen
+    """
+    for s in prange(close2d.shape[0]):
+        state = np.empty(STATE_SIZE)
+        compute_all(
+            close2d[s], ema_p, rsi_p, fast, slow, signal,
+            out_ema[s], out_rsi[s], out_macd[s], out_sig[s], out_hist[s], state
+        )
+        rolling_mean(volume2d[s], vol_p, out_vol[s])
+
+
+# Firmas con las que build_kernels.py exporta los kernels a la extensión AOT:
+# cierres, volúmenes y estado en float64, salidas en float32 (INDICATOR_DTYPE)
+_AOT_PERIODS = 'i8, i8, i8, i8, i8'
+_AOT_OUTPUTS = 'f4[::1], f4[::1], f4[::1], f4[::1], f4[::1]'
+
+AOT_SIGNATURES = {
+    'warmup_length': f'i8({_AOT_PERIODS})',
+    'compute_all': f'void(f8[::1], {_AOT_PERIODS}, {_AOT_OUTPUTS}, f8[::1])',
+    'resume_all': f'void(f8[::1], i8, {_AOT_PERIODS}, {_AOT_OUTPUTS}, f8[::1])',
+    'rolling_mean': 'void(f8[::1], i8, f4[::1])',
+}
+
+
+def checked_aot_kernel(kernel, signature):
+    """
+    Envuelve un kernel de la extensión AOT validando los arrays que recibe.
+
+    Los wrappers generados por numba.pycc no comprueban el dtype ni la
+    contigüidad de los arrays: un buffer float64 donde se exportó float32
+    corrompe memoria en lugar de fallar. El envoltorio lanza TypeError antes
+    de llamar al kernel si algún array no coincide con la firma exportada.
+
+    Args:
+        kernel: Función exportada por la extensión
+        signature: Firma con la que se exportó (ver AOT_SIGNATURES)
+
+    Returns:
+        Función con la misma interfaz que el kernel
+    """
+    arg_types = signature[signature.index('(') + 1:-1].split(', ')
+    expected = tuple(
+        np.dtype(arg_type[:2]) if arg_type.endswith('[::1]') else None
+        for arg_type in arg_types
+    )
+
+    def checked(*args):
+        if len(args) != len(expected):
+            raise TypeError(
+                f"{kernel.__name__}: se esperaban {len(expected)} argumentos, "
+                f"se recibieron {len(args)}"
+            )
+        for position, (arg, dtype) in enumerate(zip(args, expected)):
+            if dtype is None:
+                continue
+            if not (
+                isinstance(arg, np.ndarray)
+                and arg.dtype == dtype
+                and arg.ndim == 1
+                and arg.flags.c_contiguous
+            ):
+                raise TypeError(
+                    f"{kernel.__name__}: el argumento {position} debe ser un array "
+                    f"{dtype} 1D contiguo, se recibió {getattr(arg, 'dtype', type(arg))}"
+                )
+        return kernel(*args)
+
+    checked.__name__ = kernel.__name__
+    checked.__doc__ = kernel.__doc__
+    return checked
+
+
+def kernel_source_hash():
+    """
+    Calcula la huella del código de este módulo, que incluye AOT_SIGNATURES.
+
+    build_kernels.py la incrusta en la extensión para poder detectar una
+    extensión compilada con una versión anterior de los kernels.
+
+    Returns:
+        Entero positivo de 60 bits (cabe en el i8 exportado)
+    """
+    with open(__file__, 'rb') as source:
+        return int(hashlib.sha256(source.read()).hexdigest()[:15], 16)
+
+
+def select_kernels(extension):
+    """
+    Elige entre los kernels de la extensión AOT y los kernels JIT de este módulo.
+
+    La extensión solo se usa si su huella coincide con kernel_source_hash();
+    si no, se avisa y se recurre al JIT en lugar de ejecutar numéricas antiguas.
+
+    Args:
+        extension: Módulo core._phoenix_kernels, o None si no está compilado
+
+    Returns:
+        Tupla (compute_all, resume_all, rolling_mean, warmup_length)
+    """
+    names = ('compute_all', 'resume_all', 'rolling_mean', 'warmup_length')
+
+    if extension is not None:
+        source_hash = getattr(extension, 'source_hash', None)
+        if source_hash is not None and source_hash() == kernel_source_hash():
+            return tuple(
+                checked_aot_kernel(getattr(extension, name), AOT_SIGNATURES[name])
+                for name in names
+            )
+        logging.getLogger(__name__).warning(
+            "La extensión %s no corresponde al código actual de los kernels; "
+            "se usan los kernels JIT (ejecutar build_kernels.py para regenerarla)",
+            extension.__name__
+        )
+
+    return tuple(globals()[name] for name in names)
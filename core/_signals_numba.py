@@ -0,0 +1,77 @@
+"""
+Kernels compilados con Numba para el Motor de Señales de Trading.
+
+Contiene la versión por lotes de la detección de transiciones, pensada para
+recorrer un histórico completo (backtesting) en una sola llamada en lugar de
+invocar analyze_signals vela a vela.
+"""
+
+import numpy as np
+from numba import njit
+
+
+# Códigos de señal escritos por scan_signals
+NO_SIGNAL_CODE = 0
+BULLISH_CODE = 1
+BEARISH_CODE = -1
+
+
+@njit(cache=True)
+def scan_signals(close, volume, ema21, rsi14, macd_hist, vol_avg, out):
+    """
+    Detecta las transiciones alcistas y bajistas de todas las velas en una pasada.
+
+    Aplica las mismas reglas que TradingSignalsEngine: una señal se emite en la
+    vela i si todas sus condiciones se cumplen en i y no en i-1. Las velas sin
+    vela anterior, o con algún valor NaN en i o i-1 (p. ej. el calentamiento de
+    los indicadores), quedan sin señal.
+
+    Args:
+        close: Array float64 con los precios de cierre
+        volume: Array float64 con los volúmenes
+        ema21: Array float64 con la EMA
+        rsi14: Array float64 con el RSI
+        macd_hist: Array float64 con el histograma MACD
+        vol_avg: Array float64 con la media de volumen
+        out: Array int8 de salida con BULLISH_CODE, BEARISH_CODE o NO_SIGNAL_CODE
+    """
+    n = close.shape[0]
+    if n == 0:
+        return
+    out[0] = NO_SIGNAL_CODE
+
+    prev_valid = False
+    prev_bull = False
+    prev_bear = False
+
+    for i in range(n):
+        c = close[i]
+        e = ema21[i]
+        r = rsi14[i]
+        h = macd_hist[i]
+        v = volume[i]
+        va = vol_avg[i]
+
+        # Las comparaciones con NaN son False; se descarta la vela explícitamente
+        valid = not (
+            np.isnan(c) or np.isnan(e) or np.isnan(r)
+            or np.isnan(h) or np.isnan(v) or np.isnan(va)
+        )
+
+        volume_high = v > va
+        bull = c > e and 30.0 <= r <= 50.0 and h > 0.0 and volume_high
+        bear = c < e and 50.0 <= r <= 70.0 and h < 0.0 and volume_high
+
+        if i > 0:
+            if not (valid and prev_valid):
+                out[i] = NO_SIGNAL_CODE
+            elif bull and not prev_bull:
+                out[i] = BULLISH_CODE
+            elif bear and not prev_bear:
+                out[i] = BEARISH_CODE
+            else:
+                out[i] = NO_SIGNAL_CODE
+
+        prev_valid = valid
+        prev_bull = bull
+        prev_bear = bear
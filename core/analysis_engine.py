@@ -3,19 +3,55 @@ Motor de Análisis Técnico para el Proyecto Phoenix.
 
 Este módulo implementa el corazón computacional del sistema, responsable de
 calcular todos los indicadores técnicos necesarios para la estrategia de trading
-utilizando pandas-ta según las especificaciones del documento.
+mediante kernels compilados con Numba según las especificaciones del documento.
 """
 
 import pandas as pd
-import pandas_ta as ta
 import logging
-from typing import Optional, Dict, Any
+from collections import deque
+from typing import Optional, Dict, Any, List, Tuple
 import numpy as np
 
+from core._indicators_numba import STATE_SIZE, compute_all_batch, select_kernels
+
+# Kernels precompilados por build_kernels.py. Sin la extensión, o si se compiló
+# con otra versión de los kernels, se usan los kernels JIT.
+try:
+    from core import _phoenix_kernels
+except ImportError:
+    _phoenix_kernels = None
+compute_all, resume_all, rolling_mean, warmup_length = select_kernels(_phoenix_kernels)
 from utils.config_manager import ConfigManager
 from utils.exceptions import AnalysisError, InsufficientDataError
 
 
+# Nombres finales de las columnas de indicadores, en el orden en que se añaden.
+# Los de precio siguen el orden de los arrays de salida de los kernels.
+PRICE_INDICATOR_COLUMNS = ('EMA21', 'RSI14', 'MACD', 'MACD_Signal', 'MACD_Histogram')
+INDICATOR_COLUMNS = PRICE_INDICATOR_COLUMNS + ('Volume_Avg20',)
+_EXPECTED_INDICATORS = frozenset(INDICATOR_COLUMNS)
+
+# Tipo de las columnas de indicadores. Los kernels acumulan en float64 y solo
+# convierten al almacenar; las columnas OHLCV se mantienen en float64.
+INDICATOR_DTYPE = np.float32
+
+# Columnas OHLCV requeridas en la entrada del motor
+_REQUIRED_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+_REQUIRED_COLUMN_SET = frozenset(_REQUIRED_COLUMNS)
+
+# Campos de get_latest_indicators_summary: (clave del resumen, columna del DataFrame)
+_SUMMARY_FIELDS = (
+    ('close_price', 'close'),
+    ('ema21', 'EMA21'),
+    ('rsi14', 'RSI14'),
+    ('macd', 'MACD'),
+    ('macd_signal', 'MACD_Signal'),
+    ('macd_histogram', 'MACD_Histogram'),
+    ('volume', 'volume'),
+    ('volume_avg20', 'Volume_Avg20'),
+)
+
+
 class TechnicalAnalysisEngine:
     """
     Motor de análisis técnico que enriquece los datos OHLCV con indicadores.
@@ -25,15 +61,20 @@ class TechnicalAnalysisEngine:
     la estrategia de trading definida en el documento Proyecto Phoenix.
     """
     
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(self, config_manager: ConfigManager, strict: bool = True):
         """
         Inicializa el motor de análisis técnico.
         
         Args:
             config_manager: Instancia del gestor de configuración
+            strict: Si es True, el escaneo de nulos de la entrada se realiza en
+                cada llamada. Si es False, solo hasta el primer enriquecimiento
+                exitoso (para fuentes ya validadas, como ExchangeConnector)
         """
         self.config = config_manager
         self.logger = logging.getLogger(__name__)
+        self._strict = strict
+        self._validated_once = False
         
         # Cargar parámetros de configuración
         self.ema_period = self.config.get_ema_period()
@@ -43,10 +84,27 @@ class TechnicalAnalysisEngine:
         self.macd_signal = self.config.get_macd_signal()
         self.volume_avg_period = self.config.get_volume_avg_period()
         
+        # Filas mínimas para el indicador más largo (+10 para margen de seguridad)
+        self._min_rows = max(
+            self.ema_period,
+            self.rsi_period,
+            self.macd_slow + self.macd_signal,  # MACD necesita slow + signal
+            self.volume_avg_period
+        ) + 10
+        
+        # Resultados y estado de los kernels de la última ventana calculada
+        self._indicator_cache: Optional[Dict[str, Any]] = None
+        
+        # Estado para actualizaciones vela a vela (update_with_new_bar)
+        self._stream_state: Optional[Dict[str, Any]] = None
+        
+        # Resumen de configuración memoizado junto a los períodos con que se construyó
+        self._config_summary: Optional[Tuple[Tuple[int, ...], Dict[str, int]]] = None
+        
         self.logger.info(
-            f"Motor de análisis inicializado - EMA: {self.ema_period}, "
-            f"RSI: {self.rsi_period}, MACD: {self.macd_fast}/{self.macd_slow}/{self.macd_signal}, "
-            f"Vol Avg: {self.volume_avg_period}"
+            "Motor de análisis inicializado - EMA: %d, RSI: %d, MACD: %d/%d/%d, Vol Avg: %d",
+            self.ema_period, self.rsi_period, self.macd_fast, self.macd_slow,
+            self.macd_signal, self.volume_avg_period
         )
     
     def enrich_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -63,33 +121,216 @@ class TechnicalAnalysisEngine:
             AnalysisError: Si hay errores en el cálculo de indicadores
             InsufficientDataError: Si no hay suficientes datos para los cálculos
         """
+        self.logger.info("Iniciando enriquecimiento del DataFrame con indicadores técnicos")
+        
+        # Validar DataFrame de entrada (solo lectura, no requiere copia).
+        # Los errores de validación se propagan con su tipo específico.
+        self._validate_structure(df)
+        if self._strict or not self._validated_once:
+            self._validate_no_nulls(df)
+        
         try:
-            self.logger.info("Iniciando enriquecimiento del DataFrame con indicadores técnicos")
+            enriched_df = self._enrich_core(df)
+        except Exception as e:
+            error_msg = f"Error durante el enriquecimiento del DataFrame: {str(e)}"
+            self.logger.error(error_msg)
+            raise AnalysisError(error_msg) from e
+        
+        self._validated_once = True
+        
+        self.logger.info(
+            "DataFrame enriquecido exitosamente. Columnas añadidas: %s",
+            self._get_indicator_columns()
+        )
+        
+        return enriched_df
+    
+    def _enrich_core(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calcula y añade los indicadores a un DataFrame ya validado.
+        
+        Args:
+            df: DataFrame OHLCV validado
+            
+        Returns:
+            DataFrame enriquecido con indicadores técnicos
+        """
+        # Calcular todos los indicadores técnicos sobre arrays NumPy,
+        # indexados directamente por el nombre final de su columna
+        indicators = self._calculate_price_indicators(df)
+        indicators['Volume_Avg20'] = self._calculate_volume_average(df)
+        
+        # Añadir todas las columnas de indicadores en una única operación
+        enriched_df = df.assign(**indicators)
+        
+        # Validar que todos los indicadores se calcularon correctamente
+        self._validate_indicators(enriched_df)
+        
+        # Preparar el estado para actualizaciones incrementales con update_with_new_bar
+        self._seed_stream_state(df)
+        
+        return enriched_df
+    
+    def enrich_batch(self, dfs: List[pd.DataFrame]) -> List[pd.DataFrame]:
+        """
+        Enriquece varios DataFrames OHLCV (uno por símbolo) en una sola llamada al kernel.
+        
+        Los DataFrames con el mismo número de filas se apilan en matrices
+        contiguas y se procesan en paralelo, un símbolo por hilo. Este camino
+        no utiliza el caché incremental de enrich_dataframe.
+        
+        Args:
+            dfs: Lista de DataFrames con datos OHLCV (timestamp como índice)
             
-            # Validar DataFrame de entrada
-            enriched_df = self._validate_input_dataframe(df.copy())
+        Returns:
+            Lista de DataFrames enriquecidos, en el mismo orden que la entrada
             
-            # Calcular todos los indicadores técnicos
-            enriched_df = self._calculate_ema(enriched_df)
-            enriched_df = self._calculate_rsi(enriched_df)
-            enriched_df = self._calculate_macd(enriched_df)
-            enriched_df = self._calculate_volume_average(enriched_df)
+        Raises:
+            AnalysisError: Si hay errores en el cálculo de indicadores
+            InsufficientDataError: Si algún DataFrame no tiene suficientes datos
+        """
+        self.logger.info("Iniciando enriquecimiento en lote de %d DataFrames", len(dfs))
+        
+        # Validar todas las entradas; los errores se propagan con su tipo específico
+        for df in dfs:
+            self._validate_input_dataframe(df)
+        
+        try:
+            # Agrupar por longitud: cada grupo se apila en una matriz rectangular
+            groups: Dict[int, List[int]] = {}
+            for position, df in enumerate(dfs):
+                groups.setdefault(len(df), []).append(position)
             
-            # Validar que todos los indicadores se calcularon correctamente
-            self._validate_indicators(enriched_df)
+            results: List[Optional[pd.DataFrame]] = [None] * len(dfs)
             
-            self.logger.info(
-                f"DataFrame enriquecido exitosamente. "
-                f"Columnas añadidas: {self._get_indicator_columns()}"
-            )
+            for n, positions in groups.items():
+                close2d = np.ascontiguousarray(
+                    np.vstack([dfs[p]['close'].to_numpy(dtype=np.float64) for p in positions])
+                )
+                volume2d = np.ascontiguousarray(
+                    np.vstack([dfs[p]['volume'].to_numpy(dtype=np.float64) for p in positions])
+                )
+                outputs = {
+                    name: np.empty((len(positions), n), dtype=INDICATOR_DTYPE)
+                    for name in INDICATOR_COLUMNS
+                }
+                
+                compute_all_batch(
+                    close2d,
+                    volume2d,
+                    *self._get_kernel_params(),
+                    self.volume_avg_period,
+                    *outputs.values()
+                )
+                
+                for row, position in enumerate(positions):
+                    enriched_df = dfs[position].assign(
+                        **{name: matrix[row] for name, matrix in outputs.items()}
+                    )
+                    self._validate_indicators(enriched_df)
+                    results[position] = enriched_df
             
-            return enriched_df
+            self.logger.info("Enriquecimiento en lote completado: %d DataFrames", len(dfs))
+            return results
             
         except Exception as e:
-            error_msg = f"Error durante el enriquecimiento del DataFrame: {str(e)}"
+            error_msg = f"Error durante el enriquecimiento en lote: {str(e)}"
             self.logger.error(error_msg)
             raise AnalysisError(error_msg) from e
     
+    def update_with_new_bar(self, bar: pd.Series) -> Dict[str, Optional[float]]:
+        """
+        Actualiza los indicadores con una vela en O(1), sin recalcular la ventana.
+        
+        La última vela procesada se considera abierta (pendiente), igual que en
+        el caché de enrich_dataframe. Si la vela recibida tiene el mismo
+        timestamp que la pendiente, la reemplaza (actualización de la vela en
+        curso); si es posterior, la pendiente se incorpora al estado y la nueva
+        pasa a ser la pendiente.
+        
+        Args:
+            bar: Fila de un DataFrame OHLCV con, al menos, 'close' y 'volume',
+                y su timestamp como nombre (bar.name)
+            
+        Returns:
+            Diccionario {nombre de columna: valor} con los indicadores de la vela
+            
+        Raises:
+            AnalysisError: Si no hay estado previo desde el que continuar, o si
+                la vela no tiene timestamp o es anterior a la última procesada
+        """
+        stream = self._stream_state
+        if stream is None:
+            raise AnalysisError(
+                "No hay estado de indicadores para actualizar: "
+                "se requiere una llamada previa a enrich_dataframe"
+            )
+        
+        timestamp = pd.Timestamp(getattr(bar, 'name', None))
+        if pd.isna(timestamp):
+            raise AnalysisError("La vela debe indicar su timestamp en bar.name")
+        
+        timestamp_ns = timestamp.value
+        pending_timestamp, pending_close = stream['pending']
+        if timestamp_ns < pending_timestamp:
+            raise AnalysisError(
+                f"La vela {timestamp} es anterior a la última procesada"
+            )
+        
+        close = float(bar['close'])
+        volume = float(bar['volume'])
+        params = self._get_kernel_params()
+        outputs = np.empty((len(PRICE_INDICATOR_COLUMNS), 1), dtype=INDICATOR_DTYPE)
+        
+        # Media de volumen: la ventana incluye el volumen de la vela pendiente
+        window = stream['volume_window']
+        if timestamp_ns > pending_timestamp:
+            # La vela pendiente queda cerrada: una iteración del kernel la
+            # incorpora al estado
+            resume_all(np.array([pending_close]), 0, *params, *outputs, stream['kernel'])
+            if len(window) == window.maxlen:
+                stream['volume_sum'] -= window[0]
+        else:
+            # Misma vela: se descarta el volumen parcial anterior
+            stream['volume_sum'] -= window.pop()
+        window.append(volume)
+        stream['volume_sum'] += volume
+        stream['pending'] = (timestamp_ns, close)
+        
+        # Los indicadores de la vela pendiente se calculan sobre una copia del estado
+        resume_all(np.array([close]), 0, *params, *outputs, stream['kernel'].copy())
+        
+        result: Dict[str, Optional[float]] = dict(
+            zip(PRICE_INDICATOR_COLUMNS, outputs[:, 0].tolist())
+        )
+        result['Volume_Avg20'] = (
+            stream['volume_sum'] / window.maxlen if len(window) == window.maxlen else None
+        )
+        return result
+    
+    def _seed_stream_state(self, df: pd.DataFrame) -> None:
+        """
+        Inicializa el estado incremental a partir de la última ventana calculada.
+        
+        El estado de los kernels es el de las velas cerradas (sin la última,
+        que puede seguir abierta); la última vela queda como pendiente.
+        
+        Args:
+            df: DataFrame OHLCV recién enriquecido
+        """
+        cache = self._indicator_cache
+        if cache is None:
+            self._stream_state = None
+            return
+        
+        recent_volume = df['volume'].to_numpy(dtype=np.float64)[-self.volume_avg_period:]
+        self._stream_state = {
+            'kernel': cache['state'].copy(),
+            'pending': (int(cache['timestamps'][-1]), float(cache['close'][-1])),
+            'volume_window': deque(recent_volume.tolist(), maxlen=self.volume_avg_period),
+            'volume_sum': float(recent_volume.sum()),
+        }
+    
     def _validate_input_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Valida el DataFrame de entrada para el análisis técnico.
@@ -100,18 +341,34 @@ class TechnicalAnalysisEngine:
         Returns:
             DataFrame validado
             
+        Raises:
+            InsufficientDataError: Si no hay suficientes datos
+            AnalysisError: Si la estructura del DataFrame es incorrecta
+        """
+        self._validate_structure(df)
+        self._validate_no_nulls(df)
+        return df
+    
+    def _validate_structure(self, df: pd.DataFrame) -> None:
+        """
+        Realiza las validaciones baratas de la entrada: columnas, índice y longitud.
+        
+        Args:
+            df: DataFrame OHLCV a validar
+            
         Raises:
             InsufficientDataError: Si no hay suficientes datos
             AnalysisError: Si la estructura del DataFrame es incorrecta
         """
         # Verificar columnas requeridas
-        required_columns = ['open', 'high', 'low', 'close', 'volume']
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        missing = _REQUIRED_COLUMN_SET.difference(df.columns)
         
-        if missing_columns:
+        if missing:
+            # Conservar el orden de las columnas solo al construir el mensaje
+            missing_columns = [col for col in _REQUIRED_COLUMNS if col in missing]
             raise AnalysisError(
                 f"Columnas faltantes en el DataFrame: {missing_columns}. "
-                f"Se requieren: {required_columns}"
+                f"Se requieren: {list(_REQUIRED_COLUMNS)}"
             )
         
         # Verificar que el índice sea datetime
@@ -121,162 +378,193 @@ class TechnicalAnalysisEngine:
             )
         
         # Verificar datos suficientes para el indicador más largo
-        max_period = max(
-            self.ema_period,
-            self.rsi_period,
-            self.macd_slow + self.macd_signal,  # MACD necesita slow + signal
-            self.volume_avg_period
-        )
-        
-        if len(df) < max_period + 10:  # +10 para margen de seguridad
+        if len(df) < self._min_rows:
             raise InsufficientDataError(
                 f"Datos insuficientes para calcular indicadores. "
-                f"Se requieren al menos {max_period + 10} filas, "
+                f"Se requieren al menos {self._min_rows} filas, "
                 f"pero solo hay {len(df)} disponibles"
             )
+    
+    def _validate_no_nulls(self, df: pd.DataFrame) -> None:
+        """
+        Verifica que no hay valores nulos en las columnas OHLCV (recorre todos los datos).
         
-        # Verificar que no hay valores nulos en las columnas OHLCV
-        null_counts = df[required_columns].isnull().sum()
+        Args:
+            df: DataFrame OHLCV a validar
+            
+        Raises:
+            AnalysisError: Si hay valores nulos
+        """
+        null_counts = df[list(_REQUIRED_COLUMNS)].isnull().sum()
         if null_counts.sum() > 0:
             null_info = dict(null_counts[null_counts > 0])
             raise AnalysisError(f"Valores nulos encontrados en OHLCV: {null_info}")
         
-        self.logger.debug(f"DataFrame validado: {len(df)} filas con {len(df.columns)} columnas")
-        return df
+        self.logger.debug("DataFrame validado: %d filas con %d columnas", len(df), len(df.columns))
     
-    def _calculate_ema(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_price_indicators(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
         """
-        Calcula la Media Móvil Exponencial (EMA) usando pandas-ta.
+        Calcula EMA, RSI y MACD sobre el precio de cierre con un kernel Numba fusionado.
+        
+        El kernel recorre el array de cierres una sola vez y escribe los cinco
+        resultados en buffers preasignados. Entre llamadas sucesivas se reutiliza
+        el trabajo previo: si la ventana es idéntica a la anterior se devuelven
+        los resultados cacheados, y si solapa con ella el cálculo continúa desde
+        el estado guardado en la última vela cerrada, procesando solo las filas nuevas.
         
         Args:
             df: DataFrame con datos OHLCV
             
         Returns:
-            DataFrame con columna EMA añadida
+            Diccionario {nombre de columna: array} con EMA21, RSI14, MACD,
+            MACD_Signal y MACD_Histogram
         """
-        self.logger.debug(f"Calculando EMA con período {self.ema_period}")
-        
-        # Calcular EMA usando pandas-ta
-        # La función ema de pandas-ta añade automáticamente la columna al DataFrame
-        df.ta.ema(length=self.ema_period, append=True)
-        
-        # La columna se nombra automáticamente como EMA_<period>
-        ema_column = f'EMA_{self.ema_period}'
-        
-        if ema_column not in df.columns:
-            raise AnalysisError(f"Error calculando EMA: columna {ema_column} no creada")
-        
-        # Renombrar para consistencia con la estrategia
-        df.rename(columns={ema_column: 'EMA21'}, inplace=True)
+        close = np.ascontiguousarray(df['close'].to_numpy(dtype=np.float64))
+        timestamps = df.index.as_unit('ns').asi8
+        n = close.shape[0]
+        params = self._get_kernel_params()
+        
+        cache = self._indicator_cache
+        if (
+            cache is not None
+            and cache['params'] == params
+            and np.array_equal(cache['timestamps'], timestamps)
+            and np.array_equal(cache['close'], close)
+        ):
+            self.logger.debug("Ventana idéntica a la anterior: reutilizando indicadores cacheados")
+            return dict(cache['outputs'])
+        
+        outputs = {name: np.empty(n, dtype=INDICATOR_DTYPE) for name in PRICE_INDICATOR_COLUMNS}
+        arrays = tuple(outputs.values())
+        
+        # La última vela puede seguir abierta: el estado reutilizable es el de la anterior
+        settled = n - 1
+        if settled <= warmup_length(*params):
+            self.logger.debug(
+                "Calculando EMA(%d), RSI(%d) y MACD(%d/%d/%d) sin caché", *params
+            )
+            compute_all(close, *params, *arrays, np.empty(STATE_SIZE))
+            self._indicator_cache = None
+            return outputs
+        
+        settled_arrays = tuple(array[:settled] for array in arrays)
+        warm_start = self._find_warm_start(timestamps, close, outputs)
+        
+        if warm_start is not None:
+            start, state = warm_start
+            self.logger.debug(
+                "Continuando indicadores desde el estado cacheado: %d filas nuevas de %d",
+                n - start, n
+            )
+            resume_all(close[:settled], start, *params, *settled_arrays, state)
+        else:
+            self.logger.debug(
+                "Calculando EMA(%d), RSI(%d) y MACD(%d/%d/%d) en una pasada", *params
+            )
+            state = np.empty(STATE_SIZE)
+            compute_all(close[:settled], *params, *settled_arrays, state)
+        
+        settled_state = state.copy()
+        resume_all(close, settled, *params, *arrays, state)
+        
+        self._indicator_cache = {
+            'params': params,
+            'timestamps': timestamps,
+            'close': close.copy(),
+            'outputs': outputs,
+            'state': settled_state,
+        }
         
-        self.logger.debug(f"EMA calculada exitosamente. Primeros valores no nulos desde fila {self.ema_period-1}")
-        return df
+        self.logger.debug("EMA, RSI y MACD calculados exitosamente")
+        return dict(outputs)
     
-    def _calculate_rsi(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _find_warm_start(
+        self,
+        timestamps: np.ndarray,
+        close: np.ndarray,
+        outputs: Dict[str, np.ndarray]
+    ) -> Optional[Tuple[int, np.ndarray]]:
         """
-        Calcula el Índice de Fuerza Relativa (RSI) usando pandas-ta.
+        Busca en el caché un solapamiento con la ventana actual para continuar el cálculo.
+        
+        La ventana actual debe empezar en una vela cerrada de la ventana cacheada y
+        coincidir con ella (timestamps y cierres) hasta la última vela cerrada
+        cacheada. En ese caso se copian los indicadores de las filas solapadas en
+        outputs y se devuelve el estado desde el que continuar.
         
         Args:
-            df: DataFrame con datos OHLCV
+            timestamps: Timestamps de la ventana actual en nanosegundos
+            close: Precios de cierre de la ventana actual
+            outputs: Buffers de salida de los indicadores de precio
             
         Returns:
-            DataFrame con columna RSI añadida
+            Tupla (primera fila a calcular, copia del estado) o None si no hay solapamiento
         """
-        self.logger.debug(f"Calculando RSI con período {self.rsi_period}")
+        cache = self._indicator_cache
+        if cache is None or cache['params'] != self._get_kernel_params():
+            return None
         
-        # Calcular RSI usando pandas-ta
-        df.ta.rsi(length=self.rsi_period, append=True)
+        cached_timestamps = cache['timestamps']
+        cached_settled = len(cached_timestamps) - 1
         
-        # La columna se nombra automáticamente como RSI_<period>
-        rsi_column = f'RSI_{self.rsi_period}'
+        offset = int(np.searchsorted(cached_timestamps, timestamps[0]))
+        overlap = cached_settled - offset
+        if overlap <= 0 or overlap > len(close) - 1:
+            return None
         
-        if rsi_column not in df.columns:
-            raise AnalysisError(f"Error calculando RSI: columna {rsi_column} no creada")
+        if not (
+            np.array_equal(timestamps[:overlap], cached_timestamps[offset:cached_settled])
+            and np.array_equal(close[:overlap], cache['close'][offset:cached_settled])
+        ):
+            return None
         
-        # Renombrar para consistencia con la estrategia
-        df.rename(columns={rsi_column: 'RSI14'}, inplace=True)
+        for name, array in outputs.items():
+            array[:overlap] = cache['outputs'][name][offset:cached_settled]
         
-        self.logger.debug(f"RSI calculado exitosamente. Rango esperado: 0-100")
-        return df
+        return overlap, cache['state'].copy()
     
-    def _calculate_macd(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _get_kernel_params(self) -> Tuple[int, int, int, int, int]:
         """
-        Calcula el MACD (Convergencia/Divergencia de Medias Móviles) usando pandas-ta.
+        Retorna los períodos de los indicadores de precio en el orden que esperan los kernels.
         
-        Genera automáticamente las tres columnas: línea MACD, línea de señal e histograma.
-        
-        Args:
-            df: DataFrame con datos OHLCV
-            
         Returns:
-            DataFrame con columnas MACD añadidas
+            Tupla (EMA, RSI, MACD rápido, MACD lento, MACD señal)
         """
-        self.logger.debug(
-            f"Calculando MACD con parámetros fast={self.macd_fast}, "
-            f"slow={self.macd_slow}, signal={self.macd_signal}"
-        )
-        
-        # Calcular MACD usando pandas-ta
-        # Esto genera automáticamente las tres columnas
-        df.ta.macd(
-            fast=self.macd_fast,
-            slow=self.macd_slow,
-            signal=self.macd_signal,
-            append=True
+        return (
+            self.ema_period,
+            self.rsi_period,
+            self.macd_fast,
+            self.macd_slow,
+            self.macd_signal,
         )
-        
-        # Las columnas se nombran automáticamente como MACD_<fast>_<slow>_<signal>
-        macd_base = f'MACD_{self.macd_fast}_{self.macd_slow}_{self.macd_signal}'
-        macd_line_col = f'{macd_base}'
-        macd_histogram_col = f'MACDh_{self.macd_fast}_{self.macd_slow}_{self.macd_signal}'
-        macd_signal_col = f'MACDs_{self.macd_fast}_{self.macd_slow}_{self.macd_signal}'
-        
-        # Verificar que las columnas fueron creadas
-        expected_columns = [macd_line_col, macd_histogram_col, macd_signal_col]
-        missing = [col for col in expected_columns if col not in df.columns]
-        
-        if missing:
-            raise AnalysisError(f"Error calculando MACD: columnas faltantes {missing}")
-        
-        # Renombrar columnas para consistencia con la estrategia
-        df.rename(columns={
-            macd_line_col: 'MACD',
-            macd_signal_col: 'MACD_Signal', 
-            macd_histogram_col: 'MACD_Histogram'
-        }, inplace=True)
-        
-        self.logger.debug("MACD calculado exitosamente con las tres componentes")
-        return df
     
-    def _calculate_volume_average(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_volume_average(self, df: pd.DataFrame) -> np.ndarray:
         """
-        Calcula la media móvil simple del volumen usando pandas.
+        Calcula la media móvil simple del volumen con un kernel Numba de suma acumulada.
         
         Args:
             df: DataFrame con datos OHLCV
             
         Returns:
-            DataFrame con columna de media de volumen añadida
+            Array con la media de volumen
         """
-        self.logger.debug(f"Calculando media de volumen con período {self.volume_avg_period}")
+        self.logger.debug("Calculando media de volumen con período %d", self.volume_avg_period)
         
-        # Calcular media móvil simple del volumen usando pandas
-        df['Volume_Avg20'] = df['volume'].rolling(window=self.volume_avg_period).mean()
-        
-        # Verificar que la columna fue creada correctamente
-        if 'Volume_Avg20' not in df.columns:
-            raise AnalysisError("Error calculando media de volumen: columna no creada")
+        # Calcular media móvil simple del volumen sobre el array NumPy
+        volume = np.ascontiguousarray(df['volume'].to_numpy(dtype=np.float64))
+        volume_avg = np.empty(volume.shape[0], dtype=INDICATOR_DTYPE)
+        rolling_mean(volume, self.volume_avg_period, volume_avg)
         
         # Verificar que hay valores válidos (no todos NaN)
-        valid_values = df['Volume_Avg20'].notna().sum()
+        valid_values = int(np.count_nonzero(~np.isnan(volume_avg)))
         if valid_values == 0:
             raise AnalysisError("Error: todos los valores de la media de volumen son NaN")
         
         self.logger.debug(
-            f"Media de volumen calculada exitosamente. "
-            f"Valores válidos: {valid_values}/{len(df)}"
+            "Media de volumen calculada exitosamente. Valores válidos: %d/%d",
+            valid_values, len(df)
         )
-        return df
+        return volume_avg
     
     def _validate_indicators(self, df: pd.DataFrame) -> None:
         """
@@ -288,24 +576,24 @@ class TechnicalAnalysisEngine:
         Raises:
             AnalysisError: Si algún indicador no fue calculado correctamente
         """
-        expected_indicators = ['EMA21', 'RSI14', 'MACD', 'MACD_Signal', 'MACD_Histogram', 'Volume_Avg20']
-        missing_indicators = [col for col in expected_indicators if col not in df.columns]
+        missing = _EXPECTED_INDICATORS.difference(df.columns)
         
-        if missing_indicators:
+        if missing:
+            missing_indicators = [col for col in INDICATOR_COLUMNS if col in missing]
             raise AnalysisError(f"Indicadores faltantes después del cálculo: {missing_indicators}")
         
-        # Verificar que las últimas filas tienen valores válidos (no NaN)
-        # Tomamos las últimas 10 filas para verificar
-        recent_data = df[expected_indicators].tail(10)
+        # Verificar que las últimas filas tienen valores válidos (no NaN).
+        # Se recortan las últimas 10 filas de las columnas de indicadores por
+        # posición y se revisan como una única matriz float64
+        positions = df.columns.get_indexer(INDICATOR_COLUMNS)
+        recent_values = df.iloc[-10:, positions].to_numpy(dtype=np.float64)
+        empty_mask = np.isnan(recent_values).all(axis=0)
         
-        for indicator in expected_indicators:
-            recent_values = recent_data[indicator]
-            valid_recent = recent_values.notna().sum()
-            
-            if valid_recent == 0:
-                raise AnalysisError(
-                    f"El indicador {indicator} no tiene valores válidos en las últimas 10 filas"
-                )
+        if empty_mask.any():
+            empty_indicator = INDICATOR_COLUMNS[int(np.argmax(empty_mask))]
+            raise AnalysisError(
+                f"El indicador {empty_indicator} no tiene valores válidos en las últimas 10 filas"
+            )
         
         # Validaciones específicas de rangos
         self._validate_rsi_range(df)
@@ -327,17 +615,18 @@ class TechnicalAnalysisEngine:
             
             if min_rsi < 0 or max_rsi > 100:
                 self.logger.warning(
-                    f"Valores RSI fuera de rango: mín={min_rsi:.2f}, máx={max_rsi:.2f}"
+                    "Valores RSI fuera de rango: mín=%.2f, máx=%.2f", min_rsi, max_rsi
                 )
     
-    def _get_indicator_columns(self) -> list:
+    def _get_indicator_columns(self) -> Tuple[str, ...]:
         """
-        Retorna la lista de columnas de indicadores que añade este motor.
+        Retorna las columnas de indicadores que añade este motor.
         
         Returns:
-            Lista de nombres de columnas de indicadores
+            Tupla inmutable de nombres de columnas de indicadores (constante
+            del módulo, sin copia por llamada)
         """
-        return ['EMA21', 'RSI14', 'MACD', 'MACD_Signal', 'MACD_Histogram', 'Volume_Avg20']
+        return INDICATOR_COLUMNS
     
     def get_latest_indicators_summary(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -352,28 +641,38 @@ class TechnicalAnalysisEngine:
         if len(df) == 0:
             return {}
         
-        latest_row = df.iloc[-1]
-        
-        return {
-            'timestamp': df.index[-1].strftime('%Y-%m-%d %H:%M:%S'),
-            'close_price': float(latest_row['close']),
-            'ema21': float(latest_row['EMA21']) if pd.notna(latest_row['EMA21']) else None,
-            'rsi14': float(latest_row['RSI14']) if pd.notna(latest_row['RSI14']) else None,
-            'macd': float(latest_row['MACD']) if pd.notna(latest_row['MACD']) else None,
-            'macd_signal': float(latest_row['MACD_Signal']) if pd.notna(latest_row['MACD_Signal']) else None,
-            'macd_histogram': float(latest_row['MACD_Histogram']) if pd.notna(latest_row['MACD_Histogram']) else None,
-            'volume': float(latest_row['volume']),
-            'volume_avg20': float(latest_row['Volume_Avg20']) if pd.notna(latest_row['Volume_Avg20']) else None,
-        }
+        # Extraer la última fila de una vez como array float64 en el orden del resumen
+        positions = df.columns.get_indexer([column for _, column in _SUMMARY_FIELDS])
+        if (positions < 0).any():
+            missing = [column for (_, column), pos in zip(_SUMMARY_FIELDS, positions) if pos < 0]
+            raise AnalysisError(f"Columnas faltantes para el resumen de indicadores: {missing}")
+        
+        values = df.iloc[-1:, positions].to_numpy(dtype=np.float64)[0]
+        is_nan = np.isnan(values).tolist()
+        
+        summary: Dict[str, Any] = {'timestamp': df.index[-1].strftime('%Y-%m-%d %H:%M:%S')}
+        for (key, _), value, missing_value in zip(_SUMMARY_FIELDS, values.tolist(), is_nan):
+            summary[key] = None if missing_value else value
+        
+        return summary
     
     def get_configuration_summary(self) -> Dict[str, int]:
         """
         Obtiene un resumen de la configuración actual de los indicadores.
         
+        El resumen se construye una vez y se reutiliza mientras no cambien
+        los períodos configurados.
+        
         Returns:
-            Diccionario con los parámetros de configuración
+            Diccionario con los parámetros de configuración (compartido entre
+            llamadas; no debe modificarse)
         """
-        return {
+        params = (*self._get_kernel_params(), self.volume_avg_period)
+        cached = self._config_summary
+        if cached is not None and cached[0] == params:
+            return cached[1]
+        
+        summary = {
             'ema_period': self.ema_period,
             'rsi_period': self.rsi_period,
             'macd_fast': self.macd_fast,
@@ -381,3 +680,5 @@ class TechnicalAnalysisEngine:
             'macd_signal': self.macd_signal,
             'volume_avg_period': self.volume_avg_period,
         }
+        self._config_summary = (params, summary)
+        return summary
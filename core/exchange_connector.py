@@ -7,7 +7,9 @@ validación crítica de datos y configurabilidad.
 """
 
 import ccxt
+import numpy as np
 import pandas as pd
+import random
 import time
 from typing import Optional, Tuple, List, Dict, Any
 import logging
@@ -22,6 +24,29 @@ from utils.exceptions import (
 from utils.config_manager import ConfigManager
 
 
+# Equivalencias entre timeframes de ccxt y su duración, construidas una sola vez
+_TIMEFRAME_MAP: Dict[str, timedelta] = {
+    '1m': timedelta(minutes=1),
+    '5m': timedelta(minutes=5),
+    '15m': timedelta(minutes=15),
+    '30m': timedelta(minutes=30),
+    '1h': timedelta(hours=1),
+    '2h': timedelta(hours=2),
+    '4h': timedelta(hours=4),
+    '6h': timedelta(hours=6),
+    '8h': timedelta(hours=8),
+    '12h': timedelta(hours=12),
+    '1d': timedelta(days=1),
+    '3d': timedelta(days=3),
+    '1w': timedelta(weeks=1),
+}
+
+_DEFAULT_TIMEFRAME_DELTA = timedelta(hours=1)
+
+# Generador dedicado para el jitter de los reintentos
+_RNG = random.Random()
+
+
 class ExchangeConnector:
     """
     Conector robusto y configurable para exchanges de criptomonedas usando ccxt.
@@ -68,7 +93,7 @@ class ExchangeConnector:
                     f"El exchange {exchange_id} no soporta fetchOHLCV"
                 )
             
-            self.logger.info(f"Exchange {exchange_id} inicializado correctamente")
+            self.logger.info("Exchange %s inicializado correctamente", exchange_id)
             
         except AttributeError:
             raise ExchangeConnectionError(
@@ -106,8 +131,8 @@ class ExchangeConnector:
         for attempt in range(max_retries + 1):
             try:
                 self.logger.info(
-                    f"Obteniendo datos OHLCV - Símbolo: {symbol}, "
-                    f"Timeframe: {timeframe}, Límite: {limit} (Intento {attempt + 1})"
+                    "Obteniendo datos OHLCV - Símbolo: %s, Timeframe: %s, Límite: %s (Intento %d)",
+                    symbol, timeframe, limit, attempt + 1
                 )
                 
                 # Obtener datos del exchange
@@ -124,8 +149,8 @@ class ExchangeConnector:
                 validated_df = self._validate_ohlcv_data(df, symbol, timeframe, limit)
                 
                 self.logger.info(
-                    f"Datos OHLCV obtenidos y validados exitosamente. "
-                    f"Filas: {len(validated_df)}"
+                    "Datos OHLCV obtenidos y validados exitosamente. Filas: %d",
+                    len(validated_df)
                 )
                 
                 return validated_df
@@ -134,8 +159,8 @@ class ExchangeConnector:
                 last_exception = e
                 wait_time = self._calculate_backoff_time(attempt)
                 self.logger.warning(
-                    f"Rate limit excedido en intento {attempt + 1}. "
-                    f"Esperando {wait_time} segundos..."
+                    "Rate limit excedido en intento %d. Esperando %s segundos...",
+                    attempt + 1, wait_time
                 )
                 
                 if attempt < max_retries:
@@ -150,8 +175,8 @@ class ExchangeConnector:
                 last_exception = e
                 wait_time = self._calculate_backoff_time(attempt)
                 self.logger.warning(
-                    f"Error de red en intento {attempt + 1}: {str(e)}. "
-                    f"Reintentando en {wait_time} segundos..."
+                    "Error de red en intento %d: %s. Reintentando en %s segundos...",
+                    attempt + 1, e, wait_time
                 )
                 
                 if attempt < max_retries:
@@ -164,14 +189,14 @@ class ExchangeConnector:
                     
             except ccxt.ExchangeError as e:
                 last_exception = e
-                self.logger.error(f"Error del exchange en intento {attempt + 1}: {str(e)}")
+                self.logger.error("Error del exchange en intento %d: %s", attempt + 1, e)
                 
                 # Para errores del exchange, no reintentar (pueden ser permanentes)
                 raise ExchangeConnectionError(f"Error del exchange: {str(e)}")
                 
             except Exception as e:
                 last_exception = e
-                self.logger.error(f"Error inesperado en intento {attempt + 1}: {str(e)}")
+                self.logger.error("Error inesperado en intento %d: %s", attempt + 1, e)
                 
                 if attempt < max_retries:
                     wait_time = self._calculate_backoff_time(attempt)
@@ -196,21 +221,22 @@ class ExchangeConnector:
         Returns:
             DataFrame estructurado con índice de tiempo
         """
-        # Crear DataFrame con columnas apropiadas
-        df = pd.DataFrame(
-            ohlcv_data, 
-            columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-        )
+        # Un único array float64 contiguo: evita la inferencia fila a fila de tipos object
+        arr = np.asarray(ohlcv_data, dtype=np.float64).reshape(-1, 6)
         
-        # Convertir timestamp a datetime
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-        
-        # Establecer timestamp como índice
-        df.set_index('timestamp', inplace=True)
+        # Construir el índice directamente desde nanosegundos int64 (ms * 10^6),
+        # sin pasar por la inferencia de formato/unidad de pd.to_datetime
+        index = pd.DatetimeIndex(
+            arr[:, 0].astype(np.int64) * 1_000_000,
+            name='timestamp'
+        )
         
-        # Asegurar que todas las columnas numéricas sean float
-        numeric_columns = ['open', 'high', 'low', 'close', 'volume']
-        df[numeric_columns] = df[numeric_columns].astype(float)
+        # Las columnas numéricas se crean ya como float, sin un astype posterior
+        df = pd.DataFrame(
+            arr[:, 1:],
+            columns=['open', 'high', 'low', 'close', 'volume'],
+            index=index
+        )
         
         return df
     
@@ -253,55 +279,64 @@ class ExchangeConnector:
             validation_errors.append(f"Valores nulos encontrados: {null_info}")
         
         # 3. Verificar continuidad temporal
-        time_diffs = df.index.to_series().diff().dropna()
-        expected_diff = self._get_timeframe_delta(timeframe)
+        # Diferencias en nanosegundos (int64) sobre el índice, sin crear Series ni Timedelta
+        diffs = np.diff(df.index.as_unit('ns').asi8)
+        expected_ns = int(self._get_timeframe_delta(timeframe).total_seconds() * 1e9)
         
         # Tolerancia del 10% para diferencias temporales
-        tolerance = expected_diff * 0.1
-        irregular_gaps = time_diffs[
-            abs(time_diffs - expected_diff) > tolerance
-        ]
+        tolerance_ns = expected_ns // 10
+        gap_count = int((np.abs(diffs - expected_ns) > tolerance_ns).sum())
         
-        if len(irregular_gaps) > 0:
+        if gap_count > 0:
             validation_errors.append(
-                f"Gaps temporales irregulares detectados: {len(irregular_gaps)} gaps"
+                f"Gaps temporales irregulares detectados: {gap_count} gaps"
             )
         
         # 4. Verificar valores atípicos básicos
-        price_columns = ['open', 'high', 'low', 'close']
+        opens = df['open'].to_numpy()
+        highs = df['high'].to_numpy()
+        lows = df['low'].to_numpy()
+        closes = df['close'].to_numpy()
         
-        # Verificar precios negativos o zero
-        for col in price_columns:
-            invalid_prices = df[df[col] <= 0]
-            if len(invalid_prices) > 0:
-                validation_errors.append(
-                    f"Precios inválidos en columna {col}: "
-                    f"{len(invalid_prices)} valores <= 0"
-                )
+        # Verificar precios negativos o zero en una única pasada sobre las 4 columnas
+        non_positive = np.minimum(np.minimum(opens, highs), np.minimum(lows, closes)) <= 0
+        if non_positive.any():
+            # Desglose por columna solo en el camino de error
+            for col, values in (
+                ('open', opens), ('high', highs), ('low', lows), ('close', closes)
+            ):
+                invalid_count = int((values <= 0).sum())
+                if invalid_count > 0:
+                    validation_errors.append(
+                        f"Precios inválidos en columna {col}: "
+                        f"{invalid_count} valores <= 0"
+                    )
         
-        # Verificar relaciones OHLC lógicas
-        illogical_candles = df[
-            (df['high'] < df['low']) | 
-            (df['high'] < df['open']) | 
-            (df['high'] < df['close']) |
-            (df['low'] > df['open']) | 
-            (df['low'] > df['close'])
-        ]
+        # Verificar relaciones OHLC lógicas con una única máscara booleana
+        illogical = (
+            (highs < lows) |
+            (highs < opens) |
+            (highs < closes) |
+            (lows > opens) |
+            (lows > closes)
+        )
+        illogical_count = int(illogical.sum())
         
-        if len(illogical_candles) > 0:
+        if illogical_count > 0:
             validation_errors.append(
-                f"Velas con relaciones OHLC ilógicas: {len(illogical_candles)}"
+                f"Velas con relaciones OHLC ilógicas: {illogical_count}"
             )
         
         # Verificar volumen zero en velas con movimiento significativo
-        price_change = abs(df['close'] - df['open']) / df['open']
-        significant_moves = df[price_change > 0.01]  # Movimientos > 1%
-        zero_volume_moves = significant_moves[significant_moves['volume'] == 0]
+        # Movimientos > 1% expresados con multiplicación para evitar la división
+        zero_volume_moves = int(
+            ((np.abs(closes - opens) > 0.01 * opens) & (df['volume'].to_numpy() == 0)).sum()
+        )
         
-        if len(zero_volume_moves) > 0:
+        if zero_volume_moves > 0:
             validation_errors.append(
                 f"Velas con movimiento significativo pero volumen zero: "
-                f"{len(zero_volume_moves)}"
+                f"{zero_volume_moves}"
             )
         
         # Si hay errores de validación, abortar
@@ -312,7 +347,7 @@ class ExchangeConnector:
             self.logger.error(error_msg)
             raise DataValidationError(error_msg)
         
-        self.logger.info(f"Validación de datos exitosa para {symbol} {timeframe}")
+        self.logger.info("Validación de datos exitosa para %s %s", symbol, timeframe)
         return df
     
     def _get_timeframe_delta(self, timeframe: str) -> timedelta:
@@ -325,26 +360,7 @@ class ExchangeConnector:
         Returns:
             Timedelta correspondiente
         """
-        timeframe_mapping = {
-            '1m': timedelta(minutes=1),
-            '5m': timedelta(minutes=5),
-            '15m': timedelta(minutes=15),
-            '30m': timedelta(minutes=30),
-            '1h': timedelta(hours=1),
-            '2h': timedelta(hours=2),
-            '4h': timedelta(hours=4),
-            '6h': timedelta(hours=6),
-            '8h': timedelta(hours=8),
-            '12h': timedelta(hours=12),
-            '1d': timedelta(days=1),
-            '3d': timedelta(days=3),
-            '1w': timedelta(weeks=1),
-        }
-        
-        return timeframe_mapping.get(
-            timeframe, 
-            timedelta(hours=1)  # Default fallback
-        )
+        return _TIMEFRAME_MAP.get(timeframe, _DEFAULT_TIMEFRAME_DELTA)
     
     def _calculate_backoff_time(self, attempt: int) -> float:
         """
@@ -357,10 +373,7 @@ class ExchangeConnector:
             Tiempo de espera en segundos
         """
         # Backoff exponencial: 2^attempt + jitter
-        import random
-        base_wait = 2 ** attempt
-        jitter = random.uniform(0, 1)
-        return min(base_wait + jitter, 60)  # Máximo 60 segundos
+        return min((1 << attempt) + _RNG.random(), 60.0)  # Máximo 60 segundos
     
     def get_exchange_info(self) -> Dict[str, Any]:
         """
@@ -377,6 +390,28 @@ class ExchangeConnector:
             'rate_limit': self._exchange.rateLimit,
         }
     
+    def connect(self) -> Dict[str, Any]:
+        """
+        Establece la conexión con el exchange y devuelve su información.
+        
+        Carga los mercados una sola vez; la información se lee después de los
+        atributos ya disponibles en el cliente, sin más llamadas de red.
+        
+        Returns:
+            Diccionario con información del exchange (ver get_exchange_info)
+            
+        Raises:
+            ExchangeConnectionError: Si no se pueden cargar los mercados
+        """
+        try:
+            self._exchange.load_markets()
+        except Exception as e:
+            self.logger.error("Test de conexión fallido: %s", e)
+            raise ExchangeConnectionError(f"No se pudo conectar con el exchange: {str(e)}") from e
+        
+        self.logger.info("Test de conexión exitoso")
+        return self.get_exchange_info()
+    
     def test_connection(self) -> bool:
         """
         Prueba la conexión con el exchange.
@@ -385,9 +420,7 @@ class ExchangeConnector:
             True si la conexión es exitosa, False en caso contrario
         """
         try:
-            self._exchange.load_markets()
-            self.logger.info("Test de conexión exitoso")
+            self.connect()
             return True
-        except Exception as e:
-            self.logger.error(f"Test de conexión fallido: {str(e)}")
+        except ExchangeConnectionError:
             return False
@@ -7,13 +7,18 @@ Sigue las especificaciones exactas del documento Proyecto Phoenix punto 2.3.
 """
 
 import pandas as pd
+import numpy as np
 import logging
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 from enum import Enum
 
+from core._signals_numba import BEARISH_CODE, BULLISH_CODE, NO_SIGNAL_CODE, scan_signals
 from utils.exceptions import AnalysisError, InsufficientDataError
 
 
+logger = logging.getLogger(__name__)
+
+
 class SignalType(Enum):
     """Enumeración de los tipos de señal posibles."""
     BULLISH_SIGNAL = "BULLISH_SIGNAL"
@@ -21,6 +26,67 @@ class SignalType(Enum):
     NO_SIGNAL = "NO_SIGNAL"
 
 
+# Tipo de señal de cada código devuelto por analyze_signals_batch
+SIGNAL_TYPE_BY_CODE = {
+    BULLISH_CODE: SignalType.BULLISH_SIGNAL,
+    BEARISH_CODE: SignalType.BEARISH_SIGNAL,
+    NO_SIGNAL_CODE: SignalType.NO_SIGNAL,
+}
+
+# Nombres de las condiciones de cada lado, en el orden en que se evalúan
+BULLISH_CONDITIONS = (
+    'price_above_ema', 'rsi_in_range', 'macd_histogram_positive', 'volume_above_average'
+)
+BEARISH_CONDITIONS = (
+    'price_below_ema', 'rsi_in_range', 'macd_histogram_negative', 'volume_above_average'
+)
+
+# Empaquetado de condiciones en un entero de 8 bits por vela: 4 bits por lado,
+# alcista en los bajos y bajista en los altos
+_SIDE_BITS = (0b1000, 0b0100, 0b0010, 0b0001)
+_SIDE_MASK = 0b1111
+_BEARISH_SHIFT = 4
+_CONDITION_WEIGHTS = np.array(
+    _SIDE_BITS + tuple(bit << _BEARISH_SHIFT for bit in _SIDE_BITS), dtype=np.int64
+)
+
+# Claves de los valores de cada vela, en el orden de required_columns
+VALUE_KEYS = ('close', 'volume', 'ema21', 'rsi14', 'macd_histogram', 'volume_avg20')
+
+# Etiquetas de las condiciones de mercado, indexadas por el resultado de las comparaciones
+_RSI_ZONES = ("OVERSOLD", "NEUTRAL_BEARISH", "NEUTRAL_BULLISH", "OVERBOUGHT")
+_PRICE_VS_EMA = ("BELOW", "ABOVE")
+_MACD_MOMENTUM = ("NEGATIVE", "POSITIVE")
+_VOLUME_STATUS = ("LOW", "HIGH")
+
+# Líneas de la explicación comunes a todos los tipos de señal
+_EXPLANATION_DETAILS = (
+    "• RSI {rsi_value:.1f} en zona {rsi_zone}\n"
+    "• MACD Histograma {macd_momentum} ({macd_histogram:+.2f})\n"
+    "• Volumen {volume_status} (ratio: {volume_ratio:.2f}x)"
+)
+
+# Plantillas de get_signal_explanation, rellenadas con las condiciones de mercado
+_EXPLANATION_TEMPLATES = {
+    SignalType.BULLISH_SIGNAL: (
+        "🟢 SEÑAL ALCISTA DETECTADA:\n"
+        "• Precio ${current_price:,.2f} cruzó ARRIBA de EMA21 ${ema21_value:,.2f}\n"
+        + _EXPLANATION_DETAILS
+    ),
+    SignalType.BEARISH_SIGNAL: (
+        "🔴 SEÑAL BAJISTA DETECTADA:\n"
+        "• Precio ${current_price:,.2f} cruzó DEBAJO de EMA21 ${ema21_value:,.2f}\n"
+        + _EXPLANATION_DETAILS
+    ),
+    SignalType.NO_SIGNAL: (
+        "⚪ SIN SEÑAL RELEVANTE:\n"
+        "• Precio ${current_price:,.2f} vs EMA21 ${ema21_value:,.2f} ({price_vs_ema})\n"
+        + _EXPLANATION_DETAILS
+        + "\n• No se detectó transición en las condiciones de entrada"
+    ),
+}
+
+
 class TradingSignalsEngine:
     """
     Motor de detección de señales de trading que implementa lógica stateful.
@@ -30,17 +96,33 @@ class TradingSignalsEngine:
     cambian de False a True, evitando alertas redundantes.
     """
     
+    __slots__ = (
+        'required_columns',
+        '_required_set',
+        '_columns_ref',
+        '_required_positions',
+        '_last_candle',
+    )
+    
     def __init__(self):
         """Inicializa el motor de señales de trading."""
-        self.logger = logging.getLogger(__name__)
-        
         # Columnas requeridas para el análisis
         self.required_columns = [
             'close', 'volume', 'EMA21', 'RSI14', 
             'MACD_Histogram', 'Volume_Avg20'
         ]
+        self._required_set = frozenset(self.required_columns)
         
-        self.logger.info("Motor de señales de trading inicializado")
+        # Posiciones de required_columns en el último índice de columnas visto;
+        # se guarda el propio índice para invalidar las posiciones si cambia
+        self._columns_ref: Optional[pd.Index] = None
+        self._required_positions: Optional[np.ndarray] = None
+        
+        # Última vela evaluada: (timestamp, valores, bits de condiciones) para reutilizar
+        # sus condiciones como vela anterior en la siguiente llamada
+        self._last_candle: Optional[Tuple[Any, np.ndarray, int]] = None
+        
+        logger.info("Motor de señales de trading inicializado")
     
     def analyze_signals(self, enriched_df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -53,52 +135,112 @@ class TradingSignalsEngine:
             enriched_df: DataFrame con datos OHLCV e indicadores técnicos
             
         Returns:
-            Diccionario con el resultado del análisis de señales
+            Diccionario con el resultado del análisis de señales. Puede contener
+            escalares de NumPy y objetos de pandas; antes de serializarlo a JSON
+            debe pasarse por to_jsonable
             
         Raises:
             AnalysisError: Si hay errores en el análisis
             InsufficientDataError: Si no hay suficientes datos
         """
         try:
-            self.logger.info("Iniciando análisis de señales de trading")
-            
-            # Validar DataFrame de entrada
-            self._validate_input_dataframe(enriched_df)
+            # Validar DataFrame de entrada y extraer una sola vez las dos últimas
+            # velas, en el orden de required_columns
+            last_two = self._validate_input_dataframe(enriched_df)
             
-            # Verificar señal alcista
-            bullish_signal, bullish_details = self._check_bullish_signal(enriched_df)
+            timestamps = enriched_df.index[-2:]
             
-            # Verificar señal bajista
-            bearish_signal, bearish_details = self._check_bearish_signal(enriched_df)
+            # Verificar señales alcista y bajista en una única pasada
+            bullish_details, bearish_details = self._evaluate_signals(last_two, timestamps)
             
             # Determinar el resultado final
-            final_signal = self._determine_final_signal(bullish_signal, bearish_signal)
+            final_signal = self._determine_final_signal(
+                bullish_details['signal_detected'], bearish_details['signal_detected']
+            )
             
             # Preparar resultado completo
             result = {
                 'signal_type': final_signal,
-                'timestamp': enriched_df.index[-1],
-                'current_price': float(enriched_df['close'].iloc[-1]),
+                'timestamp': timestamps[-1],
+                'current_price': last_two[1, 0],
                 'bullish_analysis': bullish_details,
                 'bearish_analysis': bearish_details,
-                'market_conditions': self._get_current_market_conditions(enriched_df)
+                'market_conditions': self._get_current_market_conditions(last_two[1])
             }
             
-            self.logger.info(f"Análisis de señales completado: {final_signal.value}")
+            # Un único registro por llamada con el resultado y el estado de ambos lados
+            logger.info(
+                "Análisis de señales completado: %s "
+                "(condiciones alcistas actuales: %s, bajistas actuales: %s)",
+                final_signal.value,
+                bullish_details['all_current_met'],
+                bearish_details['all_current_met']
+            )
             return result
             
         except Exception as e:
             error_msg = f"Error durante el análisis de señales: {str(e)}"
-            self.logger.error(error_msg)
+            logger.error(error_msg)
             raise AnalysisError(error_msg) from e
     
-    def _validate_input_dataframe(self, df: pd.DataFrame) -> None:
+    def analyze_signals_batch(self, enriched_df: pd.DataFrame) -> pd.Series:
+        """
+        Detecta las señales de todas las velas del DataFrame en una sola pasada.
+        
+        Pensado para backtesting: equivale a llamar a analyze_signals sobre cada
+        prefijo del DataFrame, pero recorre los arrays con un kernel compilado.
+        Las velas con valores nulos (p. ej. el calentamiento de los indicadores)
+        y la primera vela quedan sin señal. No modifica el estado incremental
+        de analyze_signals.
+        
+        Args:
+            enriched_df: DataFrame con datos OHLCV e indicadores técnicos
+            
+        Returns:
+            Serie int8 indexada como enriched_df con BULLISH_CODE, BEARISH_CODE
+            o NO_SIGNAL_CODE (ver SIGNAL_TYPE_BY_CODE)
+            
+        Raises:
+            AnalysisError: Si faltan columnas requeridas
+            InsufficientDataError: Si no hay suficientes datos
+        """
+        if len(enriched_df) < 2:
+            raise InsufficientDataError(
+                f"Se requieren al menos 2 velas para el análisis de transición. "
+                f"Solo hay {len(enriched_df)} disponibles"
+            )
+        
+        missing = self._required_set.difference(enriched_df.columns)
+        if missing:
+            missing_columns = [col for col in self.required_columns if col in missing]
+            raise AnalysisError(
+                f"Columnas faltantes para el análisis de señales: {missing_columns}"
+            )
+        
+        columns = [
+            enriched_df[col].to_numpy(dtype=np.float64) for col in self.required_columns
+        ]
+        codes = np.empty(len(enriched_df), dtype=np.int8)
+        scan_signals(*columns, codes)
+        
+        logger.info(
+            "Análisis de señales en lote completado: %d velas, %d alcistas, %d bajistas",
+            len(codes),
+            np.count_nonzero(codes == BULLISH_CODE),
+            np.count_nonzero(codes == BEARISH_CODE)
+        )
+        return pd.Series(codes, index=enriched_df.index, name='signal')
+    
+    def _validate_input_dataframe(self, df: pd.DataFrame) -> np.ndarray:
         """
         Valida que el DataFrame tenga la estructura correcta para el análisis.
         
         Args:
             df: DataFrame a validar
             
+        Returns:
+            Array (2, 6) con required_columns de la vela anterior y la actual
+            
         Raises:
             InsufficientDataError: Si no hay suficientes datos
             AnalysisError: Si faltan columnas requeridas
@@ -110,196 +252,188 @@ class TradingSignalsEngine:
                 f"Solo hay {len(df)} disponibles"
             )
         
-        # Verificar columnas requeridas
-        missing_columns = [col for col in self.required_columns if col not in df.columns]
-        if missing_columns:
-            raise AnalysisError(
-                f"Columnas faltantes para el análisis de señales: {missing_columns}"
-            )
+        # Verificar columnas requeridas y resolver sus posiciones solo cuando
+        # cambia el índice de columnas respecto a la llamada anterior
+        if df.columns is not self._columns_ref:
+            missing = self._required_set.difference(df.columns)
+            if missing:
+                # Conservar el orden de las columnas solo al construir el mensaje
+                missing_columns = [col for col in self.required_columns if col in missing]
+                raise AnalysisError(
+                    f"Columnas faltantes para el análisis de señales: {missing_columns}"
+                )
+            
+            self._required_positions = df.columns.get_indexer(self.required_columns)
+            self._columns_ref = df.columns
         
         # Verificar que las últimas 2 filas no tienen valores nulos en columnas críticas
-        recent_data = df[self.required_columns].tail(2)
-        null_counts = recent_data.isnull().sum()
-        
-        if null_counts.sum() > 0:
-            null_info = dict(null_counts[null_counts > 0])
+        last_two = df.iloc[-2:, self._required_positions].to_numpy(dtype=np.float64)
+        null_mask = np.isnan(last_two)
+        
+        if null_mask.any():
+            null_info = {
+                col: int(count)
+                for col, count in zip(self.required_columns, null_mask.sum(axis=0))
+                if count
+            }
             raise AnalysisError(
                 f"Valores nulos encontrados en las últimas 2 velas: {null_info}"
             )
         
-        self.logger.debug("DataFrame validado para análisis de señales")
+        return last_two
     
-    def _check_bullish_signal(self, df: pd.DataFrame) -> Tuple[bool, Dict[str, Any]]:
+    def _evaluate_signals(
+        self,
+        last_two: np.ndarray,
+        timestamps: pd.Index
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
-        Verifica si se ha producido una señal alcista basada en transición de estado.
+        Evalúa las condiciones alcistas y bajistas en una única pasada.
         
         Reglas según documento Proyecto Phoenix:
-        - Precio de cierre > EMA21
-        - RSI entre 30 y 50 
-        - Histograma MACD > 0 (positivo)
-        - Volumen > Media de volumen de 20 períodos
+        - Alcista: cierre > EMA21, RSI entre 30 y 50, histograma MACD > 0
+        - Bajista: cierre < EMA21, RSI entre 50 y 70, histograma MACD < 0
+        - Ambas: volumen > media de volumen de 20 períodos
         
-        La señal se activa solo si estas condiciones son TRUE en vela actual
-        Y eran FALSE en vela anterior (detección de transición).
+        Una señal se activa solo si sus condiciones son TRUE en la vela actual
+        Y eran FALSE en la vela anterior (detección de transición). Si la vela
+        anterior es la actual de la llamada previa (mismo timestamp y mismos
+        valores) se reutilizan sus condiciones y solo se evalúa la vela actual.
         
         Args:
-            df: DataFrame con indicadores calculados
+            last_two: Array (2, 6) con required_columns de la vela anterior y la actual
+            timestamps: Timestamps de la vela anterior y la actual
             
         Returns:
-            Tupla con (señal_detectada, detalles_del_análisis)
+            Tupla con (detalles_alcistas, detalles_bajistas)
         """
-        self.logger.debug("Verificando condiciones alcistas")
-        
-        # Obtener las dos últimas velas
-        current_candle = df.iloc[-1]  # Vela actual
-        previous_candle = df.iloc[-2]  # Vela anterior
-        
-        # === CONDICIONES ALCISTAS - VELA ACTUAL ===
-        current_bullish_conditions = {
-            'price_above_ema': current_candle['close'] > current_candle['EMA21'],
-            'rsi_in_range': 30 <= current_candle['RSI14'] <= 50,
-            'macd_histogram_positive': current_candle['MACD_Histogram'] > 0,
-            'volume_above_average': current_candle['volume'] > current_candle['Volume_Avg20']
-        }
-        
-        # === CONDICIONES ALCISTAS - VELA ANTERIOR ===
-        previous_bullish_conditions = {
-            'price_above_ema': previous_candle['close'] > previous_candle['EMA21'],
-            'rsi_in_range': 30 <= previous_candle['RSI14'] <= 50,
-            'macd_histogram_positive': previous_candle['MACD_Histogram'] > 0,
-            'volume_above_average': previous_candle['volume'] > previous_candle['Volume_Avg20']
-        }
+        previous_timestamp, current_timestamp = timestamps
+        cached = self._last_candle
+        
+        if (
+            cached is not None
+            and cached[0] == previous_timestamp
+            and np.array_equal(cached[1], last_two[0])
+        ):
+            previous_bits = cached[2]
+            current_bits = self._condition_bits(last_two[1:])[0]
+        else:
+            previous_bits, current_bits = self._condition_bits(last_two)
+        
+        self._last_candle = (current_timestamp, last_two[1].copy(), current_bits)
+        
+        bullish_details = self._build_signal_details(
+            BULLISH_CONDITIONS, previous_bits & _SIDE_MASK, current_bits & _SIDE_MASK
+        )
+        bearish_details = self._build_signal_details(
+            BEARISH_CONDITIONS,
+            previous_bits >> _BEARISH_SHIFT,
+            current_bits >> _BEARISH_SHIFT
+        )
+        
+        # Los valores de ambas velas solo se materializan si hay señal que
+        # explicar o si el nivel DEBUG está activo; se comparten entre lados
+        if (
+            bullish_details['signal_detected']
+            or bearish_details['signal_detected']
+            or logger.isEnabledFor(logging.DEBUG)
+        ):
+            previous_values, current_values = self._build_value_dicts(last_two)
+            for details in (bullish_details, bearish_details):
+                details['current_values'] = current_values
+                details['previous_values'] = previous_values
+        
+        return bullish_details, bearish_details
+    
+    @staticmethod
+    def _condition_bits(rows: np.ndarray) -> List[int]:
+        """
+        Evalúa las condiciones de ambos lados para cada vela y las empaqueta en bits.
         
-        # Verificar si TODAS las condiciones actuales son True
-        all_current_conditions_met = all(current_bullish_conditions.values())
+        Cada comparación se calcula una sola vez para todas las velas a la vez.
+        Los 4 bits bajos son las condiciones alcistas y los 4 altos las bajistas,
+        con la primera condición de cada lado en el bit más significativo.
         
-        # Verificar si TODAS las condiciones anteriores son False
-        all_previous_conditions_unmet = not all(previous_bullish_conditions.values())
-        
-        # SEÑAL ALCISTA: Transición de FALSE a TRUE
-        bullish_signal_detected = all_current_conditions_met and all_previous_conditions_unmet
-        
-        # Preparar detalles del análisis
-        analysis_details = {
-            'signal_detected': bullish_signal_detected,
-            'current_conditions': current_bullish_conditions,
-            'previous_conditions': previous_bullish_conditions,
-            'all_current_met': all_current_conditions_met,
-            'all_previous_unmet': all_previous_conditions_unmet,
-            'transition_detected': all_current_conditions_met and all_previous_conditions_unmet,
-            'current_values': {
-                'close': float(current_candle['close']),
-                'ema21': float(current_candle['EMA21']),
-                'rsi14': float(current_candle['RSI14']),
-                'macd_histogram': float(current_candle['MACD_Histogram']),
-                'volume': float(current_candle['volume']),
-                'volume_avg20': float(current_candle['Volume_Avg20'])
-            },
-            'previous_values': {
-                'close': float(previous_candle['close']),
-                'ema21': float(previous_candle['EMA21']),
-                'rsi14': float(previous_candle['RSI14']),
-                'macd_histogram': float(previous_candle['MACD_Histogram']),
-                'volume': float(previous_candle['volume']),
-                'volume_avg20': float(previous_candle['Volume_Avg20'])
-            }
-        }
+        Args:
+            rows: Array (n, 6) con required_columns de cada vela
+            
+        Returns:
+            Lista con un entero de 8 bits por vela
+        """
+        close, volume, ema21, rsi14, macd_hist, vol_avg = rows.T
+        volume_high = volume > vol_avg
         
-        if bullish_signal_detected:
-            self.logger.info("🟢 SEÑAL ALCISTA DETECTADA - Transición de condiciones identificada")
-        else:
-            if all_current_conditions_met:
-                self.logger.debug("Condiciones alcistas actuales cumplidas, pero no hay transición")
-            else:
-                self.logger.debug("Condiciones alcistas actuales no cumplidas completamente")
+        flags = np.stack((
+            close > ema21, (rsi14 >= 30) & (rsi14 <= 50), macd_hist > 0, volume_high,
+            close < ema21, (rsi14 >= 50) & (rsi14 <= 70), macd_hist < 0, volume_high,
+        ), axis=-1)
         
-        return bullish_signal_detected, analysis_details
+        return (flags @ _CONDITION_WEIGHTS).tolist()
     
-    def _check_bearish_signal(self, df: pd.DataFrame) -> Tuple[bool, Dict[str, Any]]:
+    @staticmethod
+    def _build_signal_details(
+        names: Tuple[str, ...],
+        previous_bits: int,
+        current_bits: int
+    ) -> Dict[str, Any]:
         """
-        Verifica si se ha producido una señal bajista basada en transición de estado.
+        Construye el detalle del análisis de un lado (alcista o bajista).
         
-        Reglas según documento Proyecto Phoenix:
-        - Precio de cierre < EMA21
-        - RSI entre 50 y 70
-        - Histograma MACD < 0 (negativo)
-        - Volumen > Media de volumen de 20 períodos
-        
-        La señal se activa solo si estas condiciones son TRUE en vela actual
-        Y eran FALSE en vela anterior (detección de transición).
+        La transición se decide comparando las máscaras de 4 bits de ambas
+        velas; su XOR indica qué condiciones cambiaron entre una y otra.
+        current_values y previous_values quedan a None; _evaluate_signals los
+        rellena solo cuando se necesitan.
         
         Args:
-            df: DataFrame con indicadores calculados
+            names: Nombres de las condiciones, de la más a la menos significativa
+            previous_bits: Máscara de condiciones de la vela anterior
+            current_bits: Máscara de condiciones de la vela actual
             
         Returns:
-            Tupla con (señal_detectada, detalles_del_análisis)
+            Diccionario con las condiciones y la transición detectada
         """
-        self.logger.debug("Verificando condiciones bajistas")
-        
-        # Obtener las dos últimas velas
-        current_candle = df.iloc[-1]  # Vela actual
-        previous_candle = df.iloc[-2]  # Vela anterior
-        
-        # === CONDICIONES BAJISTAS - VELA ACTUAL ===
-        current_bearish_conditions = {
-            'price_below_ema': current_candle['close'] < current_candle['EMA21'],
-            'rsi_in_range': 50 <= current_candle['RSI14'] <= 70,
-            'macd_histogram_negative': current_candle['MACD_Histogram'] < 0,
-            'volume_above_average': current_candle['volume'] > current_candle['Volume_Avg20']
-        }
-        
-        # === CONDICIONES BAJISTAS - VELA ANTERIOR ===
-        previous_bearish_conditions = {
-            'price_below_ema': previous_candle['close'] < previous_candle['EMA21'],
-            'rsi_in_range': 50 <= previous_candle['RSI14'] <= 70,
-            'macd_histogram_negative': previous_candle['MACD_Histogram'] < 0,
-            'volume_above_average': previous_candle['volume'] > previous_candle['Volume_Avg20']
-        }
-        
         # Verificar si TODAS las condiciones actuales son True
-        all_current_conditions_met = all(current_bearish_conditions.values())
+        all_current_met = current_bits == _SIDE_MASK
         
         # Verificar si TODAS las condiciones anteriores son False
-        all_previous_conditions_unmet = not all(previous_bearish_conditions.values())
-        
-        # SEÑAL BAJISTA: Transición de FALSE a TRUE
-        bearish_signal_detected = all_current_conditions_met and all_previous_conditions_unmet
-        
-        # Preparar detalles del análisis
-        analysis_details = {
-            'signal_detected': bearish_signal_detected,
-            'current_conditions': current_bearish_conditions,
-            'previous_conditions': previous_bearish_conditions,
-            'all_current_met': all_current_conditions_met,
-            'all_previous_unmet': all_previous_conditions_unmet,
-            'transition_detected': all_current_conditions_met and all_previous_conditions_unmet,
-            'current_values': {
-                'close': float(current_candle['close']),
-                'ema21': float(current_candle['EMA21']),
-                'rsi14': float(current_candle['RSI14']),
-                'macd_histogram': float(current_candle['MACD_Histogram']),
-                'volume': float(current_candle['volume']),
-                'volume_avg20': float(current_candle['Volume_Avg20'])
+        all_previous_unmet = previous_bits != _SIDE_MASK
+        
+        # SEÑAL: Transición de FALSE a TRUE
+        signal_detected = all_current_met and all_previous_unmet
+        
+        changed_bits = previous_bits ^ current_bits
+        
+        return {
+            'signal_detected': signal_detected,
+            'current_conditions': {
+                name: bool(current_bits & bit) for name, bit in zip(names, _SIDE_BITS)
             },
-            'previous_values': {
-                'close': float(previous_candle['close']),
-                'ema21': float(previous_candle['EMA21']),
-                'rsi14': float(previous_candle['RSI14']),
-                'macd_histogram': float(previous_candle['MACD_Histogram']),
-                'volume': float(previous_candle['volume']),
-                'volume_avg20': float(previous_candle['Volume_Avg20'])
-            }
+            'previous_conditions': {
+                name: bool(previous_bits & bit) for name, bit in zip(names, _SIDE_BITS)
+            },
+            'changed_conditions': [
+                name for name, bit in zip(names, _SIDE_BITS) if changed_bits & bit
+            ],
+            'all_current_met': all_current_met,
+            'all_previous_unmet': all_previous_unmet,
+            'transition_detected': signal_detected,
+            'current_values': None,
+            'previous_values': None
         }
+    
+    @staticmethod
+    def _build_value_dicts(last_two: np.ndarray) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """
+        Convierte las dos últimas velas en diccionarios de valores.
         
-        if bearish_signal_detected:
-            self.logger.info("🔴 SEÑAL BAJISTA DETECTADA - Transición de condiciones identificada")
-        else:
-            if all_current_conditions_met:
-                self.logger.debug("Condiciones bajistas actuales cumplidas, pero no hay transición")
-            else:
-                self.logger.debug("Condiciones bajistas actuales no cumplidas completamente")
-        
-        return bearish_signal_detected, analysis_details
+        Args:
+            last_two: Array (2, 6) con required_columns de la vela anterior y la actual
+            
+        Returns:
+            Tupla con (valores_vela_anterior, valores_vela_actual)
+        """
+        previous_row, current_row = last_two.tolist()
+        return dict(zip(VALUE_KEYS, previous_row)), dict(zip(VALUE_KEYS, current_row))
     
     def _determine_final_signal(self, bullish_signal: bool, bearish_signal: bool) -> SignalType:
         """
@@ -314,7 +448,7 @@ class TradingSignalsEngine:
         """
         if bullish_signal and bearish_signal:
             # Caso teóricamente imposible, pero por robustez
-            self.logger.warning("CONFLICTO: Señales alcista y bajista detectadas simultáneamente")
+            logger.warning("CONFLICTO: Señales alcista y bajista detectadas simultáneamente")
             return SignalType.NO_SIGNAL
         elif bullish_signal:
             return SignalType.BULLISH_SIGNAL
@@ -323,49 +457,40 @@ class TradingSignalsEngine:
         else:
             return SignalType.NO_SIGNAL
     
-    def _get_current_market_conditions(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _get_current_market_conditions(self, current_candle: np.ndarray) -> Dict[str, Any]:
         """
         Obtiene un resumen de las condiciones actuales del mercado.
         
+        Cada categoría se resuelve indexando una tupla de etiquetas con el
+        resultado de las comparaciones, sin cadenas de if/elif.
+        
         Args:
-            df: DataFrame con indicadores
+            current_candle: Valores de required_columns de la vela actual
             
         Returns:
             Diccionario con condiciones del mercado
         """
-        current_candle = df.iloc[-1]
+        # Escalares nativos (float de Python): sus comparaciones son bool,
+        # válidos como índice, y no requieren conversión al devolverlos
+        close, volume, ema21, rsi_value, macd_histogram, volume_avg = current_candle.tolist()
         
-        # Determinar tendencia basada en EMA
-        price_vs_ema = "ABOVE" if current_candle['close'] > current_candle['EMA21'] else "BELOW"
+        # Zona RSI: <30, [30, 50], (50, 70], >70
+        rsi_zone = _RSI_ZONES[(rsi_value >= 30) + (rsi_value > 50) + (rsi_value > 70)]
         
-        # Categorizar RSI
-        rsi_value = current_candle['RSI14']
-        if rsi_value < 30:
-            rsi_zone = "OVERSOLD"
-        elif rsi_value > 70:
-            rsi_zone = "OVERBOUGHT"
-        elif 30 <= rsi_value <= 50:
-            rsi_zone = "NEUTRAL_BEARISH"
-        else:  # 50 < rsi <= 70
-            rsi_zone = "NEUTRAL_BULLISH"
-        
-        # Determinar momentum MACD
-        macd_momentum = "POSITIVE" if current_candle['MACD_Histogram'] > 0 else "NEGATIVE"
-        
-        # Analizar volumen
-        volume_ratio = current_candle['volume'] / current_candle['Volume_Avg20']
-        volume_status = "HIGH" if volume_ratio > 1.0 else "LOW"
+        # Media de volumen nula (p. ej. tras huecos sin negociación): ratio 0.
+        # El estado se deriva de la misma comparación que las condiciones de señal
+        volume_ratio = volume / volume_avg if volume_avg else 0.0
         
         return {
-            'price_vs_ema': price_vs_ema,
+            'price_vs_ema': _PRICE_VS_EMA[close > ema21],
             'rsi_zone': rsi_zone,
-            'rsi_value': float(rsi_value),
-            'macd_momentum': macd_momentum,
-            'macd_histogram': float(current_candle['MACD_Histogram']),
-            'volume_status': volume_status,
-            'volume_ratio': float(volume_ratio),
-            'current_price': float(current_candle['close']),
-            'ema21_value': float(current_candle['EMA21'])
+            'rsi_value': rsi_value,
+            'macd_momentum': _MACD_MOMENTUM[macd_histogram > 0],
+            'macd_histogram': macd_histogram,
+            'volume_status': _VOLUME_STATUS[volume > volume_avg],
+            'volume_ratio': volume_ratio,
+            'current_price': close,
+            'ema21_value': ema21
         }
     
     def get_signal_explanation(self, analysis_result: Dict[str, Any]) -> str:
@@ -378,33 +503,32 @@ class TradingSignalsEngine:
         Returns:
             Explicación textual de la señal
         """
-        signal_type = analysis_result['signal_type']
-        market_conditions = analysis_result['market_conditions']
-        
-        if signal_type == SignalType.BULLISH_SIGNAL:
-            explanation = (
-                f"🟢 SEÑAL ALCISTA DETECTADA:\n"
-                f"• Precio ${market_conditions['current_price']:,.2f} cruzó ARRIBA de EMA21 ${market_conditions['ema21_value']:,.2f}\n"
-                f"• RSI {market_conditions['rsi_value']:.1f} en zona {market_conditions['rsi_zone']}\n"
-                f"• MACD Histograma {market_conditions['macd_momentum']} ({market_conditions['macd_histogram']:+.2f})\n"
-                f"• Volumen {market_conditions['volume_status']} (ratio: {market_conditions['volume_ratio']:.2f}x)"
-            )
-        elif signal_type == SignalType.BEARISH_SIGNAL:
-            explanation = (
-                f"🔴 SEÑAL BAJISTA DETECTADA:\n"
-                f"• Precio ${market_conditions['current_price']:,.2f} cruzó DEBAJO de EMA21 ${market_conditions['ema21_value']:,.2f}\n"
-                f"• RSI {market_conditions['rsi_value']:.1f} en zona {market_conditions['rsi_zone']}\n"
-                f"• MACD Histograma {market_conditions['macd_momentum']} ({market_conditions['macd_histogram']:+.2f})\n"
-                f"• Volumen {market_conditions['volume_status']} (ratio: {market_conditions['volume_ratio']:.2f}x)"
-            )
-        else:
-            explanation = (
-                f"⚪ SIN SEÑAL RELEVANTE:\n"
-                f"• Precio ${market_conditions['current_price']:,.2f} vs EMA21 ${market_conditions['ema21_value']:,.2f} ({market_conditions['price_vs_ema']})\n"
-                f"• RSI {market_conditions['rsi_value']:.1f} en zona {market_conditions['rsi_zone']}\n"
-                f"• MACD Histograma {market_conditions['macd_momentum']} ({market_conditions['macd_histogram']:+.2f})\n"
-                f"• Volumen {market_conditions['volume_status']} (ratio: {market_conditions['volume_ratio']:.2f}x)\n"
-                f"• No se detectó transición en las condiciones de entrada"
-            )
+        template = _EXPLANATION_TEMPLATES[analysis_result['signal_type']]
+        return template.format_map(analysis_result['market_conditions'])
+
+
+def to_jsonable(value: Any) -> Any:
+    """
+    Convierte recursivamente un resultado de análisis a tipos nativos serializables.
+    
+    Los escalares de NumPy se convierten con item(), los timestamps a ISO 8601
+    y los SignalType a su valor. Debe llamarse una sola vez, en el punto de
+    serialización, no en el camino de análisis.
+    
+    Args:
+        value: Resultado de analyze_signals o cualquiera de sus valores
         
-        return explanation
+    Returns:
+        Estructura equivalente compuesta solo por tipos nativos de Python
+    """
+    if isinstance(value, dict):
+        return {key: to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, SignalType):
+        return value.value
+    return value
@@ -5,28 +5,161 @@ Demuestra la integración completa del conector del exchange, motor de análisis
 y la lógica de señales de trading según las especificaciones del documento "Proyecto Phoenix".
 """
 
-import asyncio
+import io
 import logging
+from typing import Any, Dict
 
 from utils.config_manager import ConfigManager
-from utils.logger import setup_logging
+from utils.logger import setup_logging, get_logger
 from core.exchange_connector import ExchangeConnector
 from core.analysis_engine import TechnicalAnalysisEngine
 from core.trading_signals import TradingSignalsEngine, SignalType
-from utils.exceptions import PhoenixError
+from utils.exceptions import PhoenixError, ExchangeConnectionError
 
 
-async def main():
+# Los miembros de SignalType son únicos: se comparan por identidad
+_BULL = SignalType.BULLISH_SIGNAL
+_BEAR = SignalType.BEARISH_SIGNAL
+_NONE = SignalType.NO_SIGNAL
+
+# Valores de indicadores de la vela actual, rellenados con market_conditions
+_INDICATOR_VALUES_TEMPLATE = (
+    "Precio actual: ${current_price:,.2f}\n"
+    "EMA21: ${ema21_value:,.2f} ({price_vs_ema})\n"
+    "RSI14: {rsi_value:.2f} ({rsi_zone})\n"
+    "MACD Histograma: {macd_histogram:+.4f} ({macd_momentum})\n"
+    "Volumen: {volume_ratio:.2f}x promedio ({volume_status})"
+)
+
+
+def _write_conditions(buf: io.StringIO, title: str, conditions: Dict[str, bool]) -> None:
+    """
+    Escribe el estado de un conjunto de condiciones en el informe.
+    
+    Args:
+        buf: Buffer del informe
+        title: Encabezado del bloque
+        conditions: Condiciones y si se cumplen
+    """
+    print(title, file=buf)
+    for condition, met in conditions.items():
+        print(f"  {'✅' if met else '❌'} {condition}", file=buf)
+
+
+def _write_bullish_details(signals_result: Dict[str, Any], buf: io.StringIO) -> None:
+    """Escribe los detalles técnicos de una señal alcista."""
+    print("🟢 SEÑAL ALCISTA DETECTADA", file=buf)
+    _write_conditions(
+        buf, "Condiciones actuales cumplidas:",
+        signals_result['bullish_analysis']['current_conditions']
+    )
+    print("Transición detectada: Las condiciones pasaron de NO cumplidas a SÍ cumplidas", file=buf)
+
+
+def _write_bearish_details(signals_result: Dict[str, Any], buf: io.StringIO) -> None:
+    """Escribe los detalles técnicos de una señal bajista."""
+    print("🔴 SEÑAL BAJISTA DETECTADA", file=buf)
+    _write_conditions(
+        buf, "Condiciones actuales cumplidas:",
+        signals_result['bearish_analysis']['current_conditions']
+    )
+    print("Transición detectada: Las condiciones pasaron de NO cumplidas a SÍ cumplidas", file=buf)
+
+
+def _write_no_signal_details(signals_result: Dict[str, Any], buf: io.StringIO) -> None:
+    """Escribe el estado de las condiciones cuando no hay señal."""
+    print("⚪ SIN SEÑAL RELEVANTE EN EL CICLO ACTUAL", file=buf)
+    print("Razón: No se detectó transición de estado en las condiciones de entrada", file=buf)
+    
+    # Mostrar estado actual de condiciones alcistas
+    _write_conditions(
+        buf, "Estado actual de condiciones alcistas:",
+        signals_result['bullish_analysis']['current_conditions']
+    )
+    
+    # Mostrar estado actual de condiciones bajistas
+    _write_conditions(
+        buf, "Estado actual de condiciones bajistas:",
+        signals_result['bearish_analysis']['current_conditions']
+    )
+
+
+# Detalles técnicos a escribir según el tipo de señal
+_DETAIL_WRITERS = {
+    _BULL: _write_bullish_details,
+    _BEAR: _write_bearish_details,
+    _NONE: _write_no_signal_details,
+}
+
+
+def _format_tick_report(signals_result: Dict[str, Any], signal_explanation: str) -> str:
+    """
+    Compone el informe completo de un ciclo de análisis de señales.
+    
+    El informe se emite como un único registro de log en lugar de uno por línea.
+    
+    Args:
+        signals_result: Resultado de TradingSignalsEngine.analyze_signals
+        signal_explanation: Explicación generada por get_signal_explanation
+        
+    Returns:
+        Texto multilínea del informe
+    """
+    signal_type = signals_result['signal_type']
+    buf = io.StringIO()
+    
+    # === RESULTADOS DEL ANÁLISIS DE SEÑALES ===
+    print("=== ANÁLISIS DE SEÑALES COMPLETADO ===", file=buf)
+    print("=== RESULTADO DE LA DETECCIÓN DE SEÑALES ===", file=buf)
+    print(signal_explanation, file=buf)
+    
+    # === DETALLES TÉCNICOS DE LA SEÑAL ===
+    print("=== DETALLES TÉCNICOS DEL ANÁLISIS ===", file=buf)
+    _DETAIL_WRITERS[signal_type](signals_result, buf)
+    
+    # === VALORES DE INDICADORES ACTUALES ===
+    print("=== VALORES DE INDICADORES EN VELA ACTUAL ===", file=buf)
+    print(f"Timestamp: {signals_result['timestamp']}", file=buf)
+    print(_INDICATOR_VALUES_TEMPLATE.format_map(signals_result['market_conditions']), file=buf)
+    
+    # === COMPARACIÓN ENTRE VELAS (DETECCIÓN DE TRANSICIÓN) ===
+    print("=== ANÁLISIS DE TRANSICIÓN ENTRE VELAS ===", file=buf)
+    
+    if signal_type is not _NONE:
+        # Hay señal - mostrar la transición
+        if signal_type is _BULL:
+            details = signals_result['bullish_analysis']
+            print("Transición Alcista Detectada:", file=buf)
+        else:
+            details = signals_result['bearish_analysis']
+            print("Transición Bajista Detectada:", file=buf)
+        
+        print(f"Vela anterior: Condiciones NO cumplidas ({details['all_previous_unmet']})", file=buf)
+        print(f"Vela actual: Condiciones SÍ cumplidas ({details['all_current_met']})", file=buf)
+        print("✅ EVENTO DE TRANSICIÓN CONFIRMADO", file=buf)
+    else:
+        print("No se detectó transición válida:", file=buf)
+        print("• Las condiciones pueden estar cumplidas en ambas velas (sin evento)", file=buf)
+        print("• O las condiciones no están completamente cumplidas en la vela actual", file=buf)
+        print("• La lógica stateful evita alertas redundantes", file=buf)
+    
+    return buf.getvalue().rstrip("\n")
+
+
+def main():
     """
     Función principal que demuestra la integración completa de la Fase I.
     Pipeline: Exchange → Análisis Técnico → Señales de Trading
+    
+    Es síncrona: todo el pipeline es bloqueante y no hay nada que esperar con await.
     """
     try:
         # Inicializar configuración
         config = ConfigManager()
         
         # Configurar logging
-        logger = setup_logging(config)
+        setup_logging(config)
+        logger = get_logger()
         logger.info("=== PROYECTO PHOENIX - FASE I: NÚCLEO DE ANÁLISIS COMPLETO ===")
         logger.info("Iniciando pipeline completo: Conector → Análisis → Señales...")
         
@@ -34,29 +167,31 @@ async def main():
         logger.info("--- PASO 1: INICIALIZANDO CONECTOR DEL EXCHANGE ---")
         connector = ExchangeConnector(config)
         
-        # Probar conexión
-        if not connector.test_connection():
+        # Conectar y obtener información del exchange en una sola llamada
+        try:
+            exchange_info = connector.connect()
+        except ExchangeConnectionError:
             logger.error("No se pudo establecer conexión con el exchange")
             return
         
-        # Obtener información del exchange
-        exchange_info = connector.get_exchange_info()
-        logger.info(f"Exchange conectado: {exchange_info['name']} ({exchange_info['id']})")
+        logger.info("Exchange conectado: %s (%s)", exchange_info['name'], exchange_info['id'])
         
         # Obtener parámetros de configuración
         symbol = config.get_trading_pair()
         timeframe = config.get_timeframe()
         limit = config.get_data_limit()
         
-        logger.info(f"Obteniendo datos OHLCV para {symbol} en {timeframe}")
+        logger.info("Obteniendo datos OHLCV para %s en %s", symbol, timeframe)
         
         # Obtener y validar datos OHLCV
         ohlcv_df = connector.fetch_ohlcv_data(symbol, timeframe, limit)
         
         logger.info("=== DATOS OHLCV OBTENIDOS ===")
-        logger.info(f"Filas obtenidas: {len(ohlcv_df)}")
-        logger.info(f"Rango temporal: {ohlcv_df.index[0]} a {ohlcv_df.index[-1]}")
-        logger.info(f"Precio actual (último cierre): {ohlcv_df['close'].iloc[-1]:.2f}")
+        logger.info("Filas obtenidas: %d", len(ohlcv_df))
+        first_timestamp, last_timestamp = ohlcv_df.index[[0, -1]]
+        last_close = ohlcv_df['close'].iat[-1]
+        logger.info("Rango temporal: %s a %s", first_timestamp, last_timestamp)
+        logger.info("Precio actual (último cierre): %.2f", last_close)
         
         # === PASO 2: MOTOR DE ANÁLISIS TÉCNICO ===
         logger.info("--- PASO 2: INICIALIZANDO MOTOR DE ANÁLISIS TÉCNICO ---")
@@ -64,15 +199,15 @@ async def main():
         
         # Mostrar configuración del motor
         analysis_config = analysis_engine.get_configuration_summary()
-        logger.info(f"Configuración del motor: {analysis_config}")
+        logger.info("Configuración del motor: %s", analysis_config)
         
         # Enriquecer DataFrame con indicadores técnicos
         logger.info("Calculando indicadores técnicos...")
         enriched_df = analysis_engine.enrich_dataframe(ohlcv_df)
         
         logger.info("=== DATAFRAME ENRIQUECIDO CON INDICADORES ===")
-        logger.info(f"Columnas totales: {len(enriched_df.columns)}")
-        logger.info(f"Indicadores añadidos: {analysis_engine._get_indicator_columns()}")
+        logger.info("Columnas totales: %d", len(enriched_df.columns))
+        logger.info("Indicadores añadidos: %s", analysis_engine._get_indicator_columns())
         
         # === PASO 3: LÓGICA DE SEÑALES DE TRADING ===
         logger.info("--- PASO 3: INICIALIZANDO MOTOR DE SEÑALES DE TRADING ---")
@@ -81,86 +216,12 @@ async def main():
         logger.info("Analizando señales de trading con lógica stateful...")
         signals_result = signals_engine.analyze_signals(enriched_df)
         
-        # === RESULTADOS DEL ANÁLISIS DE SEÑALES ===
-        logger.info("=== ANÁLISIS DE SEÑALES COMPLETADO ===")
         signal_type = signals_result['signal_type']
         
-        # Generar explicación detallada
-        signal_explanation = signals_engine.get_signal_explanation(signals_result)
-        logger.info("=== RESULTADO DE LA DETECCIÓN DE SEÑALES ===")
-        logger.info(f"\n{signal_explanation}")
-        
-        # === DETALLES TÉCNICOS DE LA SEÑAL ===
-        logger.info("=== DETALLES TÉCNICOS DEL ANÁLISIS ===")
-        
-        if signal_type == SignalType.BULLISH_SIGNAL:
-            logger.info("🟢 SEÑAL ALCISTA DETECTADA")
-            bullish_details = signals_result['bullish_analysis']
-            logger.info("Condiciones actuales cumplidas:")
-            for condition, met in bullish_details['current_conditions'].items():
-                status = "✅" if met else "❌"
-                logger.info(f"  {status} {condition}")
-            
-            logger.info("Transición detectada: Las condiciones pasaron de NO cumplidas a SÍ cumplidas")
-            
-        elif signal_type == SignalType.BEARISH_SIGNAL:
-            logger.info("🔴 SEÑAL BAJISTA DETECTADA")
-            bearish_details = signals_result['bearish_analysis']
-            logger.info("Condiciones actuales cumplidas:")
-            for condition, met in bearish_details['current_conditions'].items():
-                status = "✅" if met else "❌"
-                logger.info(f"  {status} {condition}")
-            
-            logger.info("Transición detectada: Las condiciones pasaron de NO cumplidas a SÍ cumplidas")
-            
-        else:
-            logger.info("⚪ SIN SEÑAL RELEVANTE EN EL CICLO ACTUAL")
-            logger.info("Razón: No se detectó transición de estado en las condiciones de entrada")
-            
-            # Mostrar estado actual de condiciones alcistas
-            bullish_details = signals_result['bullish_analysis']
-            logger.info("Estado actual de condiciones alcistas:")
-            for condition, met in bullish_details['current_conditions'].items():
-                status = "✅" if met else "❌"
-                logger.info(f"  {status} {condition}")
-            
-            # Mostrar estado actual de condiciones bajistas
-            bearish_details = signals_result['bearish_analysis']
-            logger.info("Estado actual de condiciones bajistas:")
-            for condition, met in bearish_details['current_conditions'].items():
-                status = "✅" if met else "❌"
-                logger.info(f"  {status} {condition}")
-        
-        # === VALORES DE INDICADORES ACTUALES ===
-        logger.info("=== VALORES DE INDICADORES EN VELA ACTUAL ===")
-        market_conditions = signals_result['market_conditions']
-        logger.info(f"Timestamp: {signals_result['timestamp']}")
-        logger.info(f"Precio actual: ${market_conditions['current_price']:,.2f}")
-        logger.info(f"EMA21: ${market_conditions['ema21_value']:,.2f} ({market_conditions['price_vs_ema']})")
-        logger.info(f"RSI14: {market_conditions['rsi_value']:.2f} ({market_conditions['rsi_zone']})")
-        logger.info(f"MACD Histograma: {market_conditions['macd_histogram']:+.4f} ({market_conditions['macd_momentum']})")
-        logger.info(f"Volumen: {market_conditions['volume_ratio']:.2f}x promedio ({market_conditions['volume_status']})")
-        
-        # === COMPARACIÓN ENTRE VELAS (DETECCIÓN DE TRANSICIÓN) ===
-        logger.info("=== ANÁLISIS DE TRANSICIÓN ENTRE VELAS ===")
-        
-        if signal_type != SignalType.NO_SIGNAL:
-            # Hay señal - mostrar la transición
-            if signal_type == SignalType.BULLISH_SIGNAL:
-                details = signals_result['bullish_analysis']
-                logger.info("Transición Alcista Detectada:")
-            else:
-                details = signals_result['bearish_analysis']
-                logger.info("Transición Bajista Detectada:")
-            
-            logger.info(f"Vela anterior: Condiciones NO cumplidas ({not details['all_previous_met']})")
-            logger.info(f"Vela actual: Condiciones SÍ cumplidas ({details['all_current_met']})")
-            logger.info("✅ EVENTO DE TRANSICIÓN CONFIRMADO")
-        else:
-            logger.info("No se detectó transición válida:")
-            logger.info("• Las condiciones pueden estar cumplidas en ambas velas (sin evento)")
-            logger.info("• O las condiciones no están completamente cumplidas en la vela actual")
-            logger.info("• La lógica stateful evita alertas redundantes")
+        # Informe del ciclo en un único registro de log
+        if logger.isEnabledFor(logging.INFO):
+            signal_explanation = signals_engine.get_signal_explanation(signals_result)
+            logger.info("\n%s", _format_tick_report(signals_result, signal_explanation))
         
         # === ESTADO FINAL DEL SISTEMA ===
         logger.info("=== FASE I - NÚCLEO DE ANÁLISIS: COMPLETADO EXITOSAMENTE ===")
@@ -168,14 +229,14 @@ async def main():
         logger.info("✅ Motor de Análisis Técnico: OPERATIVO")
         logger.info("✅ Motor de Señales de Trading: OPERATIVO")
         logger.info("✅ Lógica Stateful: Diferenciación entre estado y evento implementada")
-        logger.info(f"🎯 Resultado final del ciclo: {signal_type.value}")
+        logger.info("🎯 Resultado final del ciclo: %s", signal_type.value)
         logger.info("🚀 Sistema listo para la siguiente fase: Interfaz de Usuario y Bot de Telegram")
         
     except PhoenixError as e:
-        logger.error(f"Error del Proyecto Phoenix: {str(e)}")
+        get_logger().error("Error del Proyecto Phoenix: %s", e)
     except Exception as e:
-        logger.error(f"Error inesperado: {str(e)}", exc_info=True)
+        get_logger().error("Error inesperado: %s", e, exc_info=True)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
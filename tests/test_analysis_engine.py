@@ -0,0 +1,218 @@
+"""
+Tests del Motor de Análisis Técnico.
+"""
+
+import os
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import core.analysis_engine as analysis_engine
+from core import _indicators_numba
+from core.analysis_engine import TechnicalAnalysisEngine
+from utils.config_manager import ConfigManager
+from utils.exceptions import AnalysisError, InsufficientDataError
+
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.ini')
+
+
+def _make_ohlcv(n: int, seed: int = 0) -> pd.DataFrame:
+    """Genera un DataFrame OHLCV sintético de n velas de 2h."""
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(n).cumsum()
+    return pd.DataFrame(
+        {
+            'open': close,
+            'high': close + 1,
+            'low': close - 1,
+            'close': close,
+            'volume': rng.uniform(1, 10, n),
+        },
+        index=pd.date_range('2024-01-01', periods=n, freq='2h'),
+    )
+
+
+@pytest.fixture
+def engine() -> TechnicalAnalysisEngine:
+    return TechnicalAnalysisEngine(ConfigManager(CONFIG_FILE))
+
+
+@pytest.fixture
+def aot_checked_kernels(monkeypatch):
+    """Sustituye los kernels del motor por los JIT validados con las firmas AOT."""
+    for name, signature in _indicators_numba.AOT_SIGNATURES.items():
+        kernel = getattr(_indicators_numba, name)
+        monkeypatch.setattr(
+            analysis_engine, name, _indicators_numba.checked_aot_kernel(kernel, signature)
+        )
+
+
+def test_checked_aot_kernel_rejects_wrong_dtype():
+    rolling_mean = _indicators_numba.checked_aot_kernel(
+        _indicators_numba.rolling_mean, _indicators_numba.AOT_SIGNATURES['rolling_mean']
+    )
+    volume = np.ones(30)
+
+    with pytest.raises(TypeError):
+        rolling_mean(volume, 20, np.empty(30))
+
+    out = np.empty(30, dtype=np.float32)
+    rolling_mean(volume, 20, out)
+    assert out[-1] == 1.0
+
+
+
+def _fake_extension(source_hash):
+    """Simula core._phoenix_kernels con los kernels JIT y la huella indicada."""
+    extension = types.ModuleType('core._phoenix_kernels')
+    for name in _indicators_numba.AOT_SIGNATURES:
+        setattr(extension, name, getattr(_indicators_numba, name))
+    if source_hash is not None:
+        extension.source_hash = lambda: source_hash
+    return extension
+
+
+def test_select_kernels_uses_extension_built_from_current_source():
+    extension = _fake_extension(_indicators_numba.kernel_source_hash())
+
+    compute_all, resume_all, rolling_mean, warmup_length = _indicators_numba.select_kernels(extension)
+
+    assert compute_all is not _indicators_numba.compute_all
+    # Los kernels de la extensión se envuelven con la validación de su firma
+    with pytest.raises(TypeError):
+        rolling_mean(np.ones(30), 20, np.empty(30))
+
+
+@pytest.mark.parametrize('source_hash', [None, 0])
+def test_select_kernels_falls_back_to_jit_for_stale_extension(source_hash, caplog):
+    kernels = _indicators_numba.select_kernels(_fake_extension(source_hash))
+
+    assert kernels == (
+        _indicators_numba.compute_all,
+        _indicators_numba.resume_all,
+        _indicators_numba.rolling_mean,
+        _indicators_numba.warmup_length,
+    )
+    assert "build_kernels.py" in caplog.text
+
+def test_call_sites_use_exported_aot_dtypes(aot_checked_kernels, engine):
+    df = _make_ohlcv(300)
+
+    engine.enrich_dataframe(df.iloc[:250])
+    engine.enrich_dataframe(df.iloc[:250])
+    engine.enrich_dataframe(df.iloc[5:260])
+    engine.update_with_new_bar(df.iloc[260])
+    engine.enrich_dataframe(df.iloc[:50])
+
+
+def test_update_with_new_bar_matches_full_recompute(engine):
+    df = _make_ohlcv(300)
+    engine.enrich_dataframe(df.iloc[:250])
+
+    for i in range(250, 300):
+        result = engine.update_with_new_bar(df.iloc[i])
+
+        expected = TechnicalAnalysisEngine(engine.config).enrich_dataframe(df.iloc[:i + 1])
+        np.testing.assert_allclose(
+            [result[name] for name in analysis_engine.INDICATOR_COLUMNS],
+            expected.iloc[-1][list(analysis_engine.INDICATOR_COLUMNS)].to_numpy(dtype=np.float64),
+            rtol=1e-6,
+        )
+
+
+
+def test_update_with_resent_bar_replaces_pending_bar(engine):
+    df = _make_ohlcv(300)
+    engine.enrich_dataframe(df.iloc[:250])
+
+    # La vela en curso llega primero con valores parciales y después cerrada
+    partial = df.iloc[250].copy()
+    partial['close'] += 5.0
+    partial['volume'] /= 3
+    engine.update_with_new_bar(partial)
+    engine.update_with_new_bar(df.iloc[250])
+    result = engine.update_with_new_bar(df.iloc[250])
+
+    expected = TechnicalAnalysisEngine(engine.config).enrich_dataframe(df.iloc[:251])
+    np.testing.assert_allclose(
+        [result[name] for name in analysis_engine.INDICATOR_COLUMNS],
+        expected.iloc[-1][list(analysis_engine.INDICATOR_COLUMNS)].to_numpy(dtype=np.float64),
+        rtol=1e-6,
+    )
+
+    # La vela siguiente continúa desde la versión cerrada, no desde la parcial
+    result = engine.update_with_new_bar(df.iloc[251])
+    expected = TechnicalAnalysisEngine(engine.config).enrich_dataframe(df.iloc[:252])
+    np.testing.assert_allclose(
+        [result[name] for name in analysis_engine.INDICATOR_COLUMNS],
+        expected.iloc[-1][list(analysis_engine.INDICATOR_COLUMNS)].to_numpy(dtype=np.float64),
+        rtol=1e-6,
+    )
+
+
+def test_update_with_last_enriched_bar_matches_enrich(engine):
+    df = _make_ohlcv(300)
+    enriched = engine.enrich_dataframe(df.iloc[:250])
+
+    # La última vela de la ventana queda pendiente: reenviarla no la cuenta dos veces
+    result = engine.update_with_new_bar(df.iloc[249])
+
+    np.testing.assert_allclose(
+        [result[name] for name in analysis_engine.INDICATOR_COLUMNS],
+        enriched.iloc[-1][list(analysis_engine.INDICATOR_COLUMNS)].to_numpy(dtype=np.float64),
+        rtol=1e-6,
+    )
+
+
+def test_update_with_older_bar_raises(engine):
+    df = _make_ohlcv(300)
+    engine.enrich_dataframe(df.iloc[:250])
+
+    with pytest.raises(AnalysisError):
+        engine.update_with_new_bar(df.iloc[248])
+
+    with pytest.raises(AnalysisError):
+        engine.update_with_new_bar({'close': 100.0, 'volume': 1.0})
+
+def test_overlapping_window_matches_cold_run(engine):
+    df = _make_ohlcv(300)
+    engine.enrich_dataframe(df.iloc[:250])
+
+    warm = engine.enrich_dataframe(df.iloc[:260])
+    cold = TechnicalAnalysisEngine(engine.config).enrich_dataframe(df.iloc[:260])
+
+    pd.testing.assert_frame_equal(warm, cold)
+
+
+def test_shifted_window_matches_cold_run_over_full_history(engine):
+    df = _make_ohlcv(300)
+    engine.enrich_dataframe(df.iloc[:250])
+
+    warm = engine.enrich_dataframe(df.iloc[10:260])
+
+    # Los indicadores de precio continúan el historial completo ya calculado
+    price_columns = list(analysis_engine.PRICE_INDICATOR_COLUMNS)
+    full = TechnicalAnalysisEngine(engine.config).enrich_dataframe(df.iloc[:260])
+    pd.testing.assert_frame_equal(warm[price_columns], full.iloc[10:][price_columns])
+
+    # La media de volumen se recalcula sobre la ventana recibida
+    window = TechnicalAnalysisEngine(engine.config).enrich_dataframe(df.iloc[10:260])
+    pd.testing.assert_series_equal(warm['Volume_Avg20'], window['Volume_Avg20'])
+
+
+def test_enrich_batch_matches_enrich_dataframe(engine):
+    dfs = [_make_ohlcv(250, seed=1), _make_ohlcv(250, seed=2), _make_ohlcv(180, seed=3)]
+
+    batch = engine.enrich_batch(dfs)
+
+    for df, enriched in zip(dfs, batch):
+        expected = TechnicalAnalysisEngine(engine.config).enrich_dataframe(df)
+        pd.testing.assert_frame_equal(enriched, expected)
+
+
+def test_enrich_batch_propagates_insufficient_data(engine):
+    with pytest.raises(InsufficientDataError):
+        engine.enrich_batch([_make_ohlcv(250), _make_ohlcv(20)])
@@ -0,0 +1,72 @@
+"""
+Tests del Conector del Exchange.
+"""
+
+import os
+
+import ccxt
+import pytest
+
+from core.exchange_connector import ExchangeConnector
+from utils.config_manager import ConfigManager
+from utils.exceptions import ExchangeConnectionError
+
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.ini')
+
+
+class _StubExchange:
+    """Cliente ccxt mínimo que cuenta las llamadas a load_markets."""
+    
+    id = 'stub'
+    name = 'Stub Exchange'
+    has = {'fetchOHLCV': True}
+    timeframes = {'2h': '2h'}
+    rateLimit = 50
+    
+    def __init__(self, error=None):
+        self.error = error
+        self.load_markets_calls = 0
+    
+    def load_markets(self):
+        self.load_markets_calls += 1
+        if self.error is not None:
+            raise self.error
+        return {}
+
+
+@pytest.fixture
+def connector() -> ExchangeConnector:
+    return ExchangeConnector(ConfigManager(CONFIG_FILE))
+
+
+def test_connect_loads_markets_once_and_returns_info(connector):
+    stub = _StubExchange()
+    connector._exchange = stub
+
+    info = connector.connect()
+
+    assert stub.load_markets_calls == 1
+    assert info == {
+        'id': 'stub',
+        'name': 'Stub Exchange',
+        'has_fetch_ohlcv': True,
+        'timeframes': {'2h': '2h'},
+        'rate_limit': 50,
+    }
+
+
+def test_connect_raises_exchange_connection_error(connector):
+    connector._exchange = _StubExchange(ccxt.NetworkError("sin red"))
+
+    with pytest.raises(ExchangeConnectionError, match="sin red"):
+        connector.connect()
+
+
+def test_test_connection_delegates_to_connect(connector):
+    connector._exchange = _StubExchange()
+    assert connector.test_connection() is True
+    assert connector._exchange.load_markets_calls == 1
+
+    connector._exchange = _StubExchange(ccxt.NetworkError("sin red"))
+    assert connector.test_connection() is False
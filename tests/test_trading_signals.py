@@ -0,0 +1,105 @@
+"""
+Tests del Motor de Señales de Trading.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core._signals_numba import BEARISH_CODE, BULLISH_CODE, NO_SIGNAL_CODE
+from core.trading_signals import (
+    SIGNAL_TYPE_BY_CODE,
+    SignalType,
+    TradingSignalsEngine,
+    to_jsonable,
+)
+from utils.exceptions import AnalysisError
+
+
+def test_volume_status_matches_signal_condition_with_zero_average():
+    # Vela anterior sin condiciones alcistas (RSI fuera de zona); actual con todas
+    df = pd.DataFrame(
+        {
+            'close': [101.0, 102.0],
+            'volume': [5.0, 5.0],
+            'EMA21': [100.0, 100.0],
+            'RSI14': [60.0, 40.0],
+            'MACD_Histogram': [0.5, 0.5],
+            'Volume_Avg20': [0.0, 0.0],
+        },
+        index=pd.date_range('2024-01-01', periods=2, freq='2h'),
+    )
+    engine = TradingSignalsEngine()
+
+    result = engine.analyze_signals(df)
+
+    assert result['signal_type'] is SignalType.BULLISH_SIGNAL
+    assert result['market_conditions']['volume_status'] == "HIGH"
+    assert "Volumen HIGH" in engine.get_signal_explanation(result)
+
+
+def _make_enriched(n: int, seed: int = 0) -> pd.DataFrame:
+    """Genera indicadores sintéticos que alternan señales alcistas y bajistas."""
+    rng = np.random.default_rng(seed)
+    ema = 100 + rng.standard_normal(n).cumsum()
+    df = pd.DataFrame(
+        {
+            'close': ema + rng.normal(0, 1, n),
+            'volume': rng.uniform(1, 10, n),
+            'EMA21': ema,
+            'RSI14': rng.uniform(25, 75, n),
+            'MACD_Histogram': rng.normal(0, 1, n),
+            'Volume_Avg20': rng.uniform(3, 8, n),
+        },
+        index=pd.date_range('2024-01-01', periods=n, freq='2h'),
+    )
+    # Calentamiento de los indicadores y huecos sueltos
+    df.iloc[:20, 2:] = np.nan
+    df.iloc[rng.choice(np.arange(20, n), 15, replace=False), rng.integers(0, 6, 15)] = np.nan
+    return df
+
+
+def test_analyze_signals_batch_matches_rolling_analyze_signals():
+    df = _make_enriched(600)
+    engine = TradingSignalsEngine()
+
+    codes = engine.analyze_signals_batch(df)
+
+    assert codes.iat[0] == NO_SIGNAL_CODE
+    assert {BULLISH_CODE, BEARISH_CODE} <= set(codes.tolist())
+    for i in range(1, len(df)):
+        window = df.iloc[i - 1:i + 1]
+        if window.isna().to_numpy().any():
+            # analyze_signals rechaza las velas con nulos; el lote no emite señal
+            with pytest.raises(AnalysisError):
+                engine.analyze_signals(window)
+            assert codes.iat[i] == NO_SIGNAL_CODE
+            continue
+
+        signal_type = engine.analyze_signals(window)['signal_type']
+        assert SIGNAL_TYPE_BY_CODE[codes.iat[i]] is signal_type, window.index[-1]
+
+
+def test_to_jsonable_round_trips_signal_result_through_json():
+    df = _make_enriched(60).iloc[-2:].fillna(1.0)
+    result = TradingSignalsEngine().analyze_signals(df)
+    result['extra'] = {
+        'float32': np.float32(1.5),
+        'int64': np.int64(3),
+        'bool': np.bool_(True),
+        'timestamps': (pd.Timestamp('2024-01-01 02:00'),),
+    }
+
+    loaded = json.loads(json.dumps(to_jsonable(result)))
+
+    assert loaded['signal_type'] == result['signal_type'].value
+    assert loaded['timestamp'] == result['timestamp'].isoformat()
+    assert loaded['extra'] == {
+        'float32': 1.5,
+        'int64': 3,
+        'bool': True,
+        'timestamps': ['2024-01-01T02:00:00'],
+    }
+    assert loaded['market_conditions'] == to_jsonable(result['market_conditions'])
@@ -7,12 +7,52 @@ desde archivos .env y config.ini.
 
 import os
 import configparser
-from typing import Optional, Dict, Any
+import types
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Mapping, Set
 from dotenv import load_dotenv
 
 from utils.exceptions import ConfigurationError
 
 
+@dataclass(frozen=True)
+class PhoenixSettings:
+    """Parámetros de config.ini ya convertidos a su tipo, con acceso por atributo."""
+    pair: str
+    timeframe: str
+    ema_period: int
+    rsi_period: int
+    macd_fast: int
+    macd_slow: int
+    macd_signal: int
+    volume_avg_period: int
+    ai_provider: str
+    data_limit: int
+    log_level: str
+    log_file: str
+
+
+# Valores por defecto de config.ini, indexados por "sección.clave"
+_DEFAULTS: Mapping[str, Any] = types.MappingProxyType({
+    'trading.pair': 'BTC/USDC',
+    'trading.timeframe': '2h',
+    'indicators.ema_period': 21,
+    'indicators.rsi_period': 14,
+    'indicators.macd_fast': 12,
+    'indicators.macd_slow': 26,
+    'indicators.macd_signal': 9,
+    'indicators.volume_avg_period': 20,
+    'ai.provider': 'gemini',
+    'data.limit': 200,
+    'logging.level': 'INFO',
+    'logging.file': 'logs/phoenix.log',
+})
+
+
+# Archivos .env ya volcados en os.environ por alguna instancia de ConfigManager
+_LOADED_ENV_FILES: Set[str] = set()
+
+
 class ConfigManager:
     """
     Gestor centralizado de configuración del sistema.
@@ -32,6 +72,11 @@ class ConfigManager:
         self.config_file = config_file
         self.env_file = env_file
         self._config = configparser.ConfigParser()
+        
+        # Valores ya resueltos de config.ini y del entorno, poblados al cargar
+        self._settings: Optional[PhoenixSettings] = None
+        self._env_cache: Dict[str, Optional[str]] = {}
+        
         self._load_configuration()
     
     def _load_configuration(self) -> None:
@@ -41,8 +86,10 @@ class ConfigManager:
         Raises:
             ConfigurationError: Si no se pueden cargar los archivos de configuración
         """
-        # Cargar variables de entorno
-        load_dotenv(self.env_file)
+        # Cargar variables de entorno (una sola vez por archivo y proceso)
+        if self.env_file not in _LOADED_ENV_FILES:
+            load_dotenv(self.env_file)
+            _LOADED_ENV_FILES.add(self.env_file)
         
         # Cargar archivo de configuración
         if not os.path.exists(self.config_file):
@@ -52,86 +99,119 @@ class ConfigManager:
             self._config.read(self.config_file, encoding='utf-8')
         except Exception as e:
             raise ConfigurationError(f"Error leyendo archivo de configuración: {str(e)}")
+        
+        self._populate_caches()
+    
+    def _populate_caches(self) -> None:
+        """
+        Resuelve una sola vez todos los parámetros conocidos y las variables de entorno.
+        
+        Los getters devuelven estos valores directamente, sin pasar por
+        configparser ni os.getenv en cada llamada.
+        """
+        self._settings = PhoenixSettings(
+            pair=self._get_config_value('trading', 'pair'),
+            timeframe=self._get_config_value('trading', 'timeframe'),
+            ema_period=self._get_config_int('indicators', 'ema_period'),
+            rsi_period=self._get_config_int('indicators', 'rsi_period'),
+            macd_fast=self._get_config_int('indicators', 'macd_fast'),
+            macd_slow=self._get_config_int('indicators', 'macd_slow'),
+            macd_signal=self._get_config_int('indicators', 'macd_signal'),
+            volume_avg_period=self._get_config_int('indicators', 'volume_avg_period'),
+            ai_provider=self._get_config_value('ai', 'provider'),
+            data_limit=self._get_config_int('data', 'limit'),
+            log_level=self._get_config_value('logging', 'level'),
+            log_file=self._get_config_value('logging', 'file'),
+        )
+        
+        self._env_cache = {
+            'EXCHANGE_ID': self._get_env_var('EXCHANGE_ID', 'binance'),
+            'API_KEY': self._get_env_var('API_KEY'),
+            'API_SECRET': self._get_env_var('API_SECRET'),
+            'TELEGRAM_BOT_TOKEN': self._get_env_var('TELEGRAM_BOT_TOKEN'),
+            'TELEGRAM_CHAT_ID': self._get_env_var('TELEGRAM_CHAT_ID'),
+            'AI_API_KEY': self._get_env_var('AI_API_KEY'),
+        }
     
     # Variables de entorno sensibles (desde .env)
     def get_exchange_id(self) -> str:
         """Obtiene el ID del exchange."""
-        return self._get_env_var('EXCHANGE_ID', 'binance')
+        return self._env_cache['EXCHANGE_ID']
     
     def get_api_key(self) -> Optional[str]:
         """Obtiene la clave API del exchange."""
-        return os.getenv('API_KEY')
+        return self._env_cache['API_KEY']
     
     def get_api_secret(self) -> Optional[str]:
         """Obtiene la clave secreta del exchange."""
-        return os.getenv('API_SECRET')
+        return self._env_cache['API_SECRET']
     
     def get_telegram_bot_token(self) -> str:
         """Obtiene el token del bot de Telegram."""
-        token = self._get_env_var('TELEGRAM_BOT_TOKEN')
+        token = self._env_cache['TELEGRAM_BOT_TOKEN']
         if not token:
             raise ConfigurationError("TELEGRAM_BOT_TOKEN es requerido")
         return token
     
     def get_telegram_chat_id(self) -> str:
         """Obtiene el ID del chat de Telegram."""
-        chat_id = self._get_env_var('TELEGRAM_CHAT_ID')
+        chat_id = self._env_cache['TELEGRAM_CHAT_ID']
         if not chat_id:
             raise ConfigurationError("TELEGRAM_CHAT_ID es requerido")
         return chat_id
     
     def get_ai_api_key(self) -> Optional[str]:
         """Obtiene la clave API para el servicio de IA."""
-        return os.getenv('AI_API_KEY')
+        return self._env_cache['AI_API_KEY']
     
     # Parámetros de configuración (desde config.ini)
     def get_trading_pair(self) -> str:
         """Obtiene el par de trading."""
-        return self._get_config_value('trading', 'pair', 'BTC/USDC')
+        return self._settings.pair
     
     def get_timeframe(self) -> str:
         """Obtiene la temporalidad."""
-        return self._get_config_value('trading', 'timeframe', '2h')
+        return self._settings.timeframe
     
     def get_ema_period(self) -> int:
         """Obtiene el período de la EMA."""
-        return self._get_config_int('indicators', 'ema_period', 21)
+        return self._settings.ema_period
     
     def get_rsi_period(self) -> int:
         """Obtiene el período del RSI."""
-        return self._get_config_int('indicators', 'rsi_period', 14)
+        return self._settings.rsi_period
     
     def get_macd_fast(self) -> int:
         """Obtiene el período rápido del MACD."""
-        return self._get_config_int('indicators', 'macd_fast', 12)
+        return self._settings.macd_fast
     
     def get_macd_slow(self) -> int:
         """Obtiene el período lento del MACD."""
-        return self._get_config_int('indicators', 'macd_slow', 26)
+        return self._settings.macd_slow
     
     def get_macd_signal(self) -> int:
         """Obtiene el período de señal del MACD."""
-        return self._get_config_int('indicators', 'macd_signal', 9)
+        return self._settings.macd_signal
     
     def get_volume_avg_period(self) -> int:
         """Obtiene el período de la media de volumen."""
-        return self._get_config_int('indicators', 'volume_avg_period', 20)
+        return self._settings.volume_avg_period
     
     def get_ai_provider(self) -> str:
         """Obtiene el proveedor de IA."""
-        return self._get_config_value('ai', 'provider', 'gemini')
+        return self._settings.ai_provider
     
     def get_data_limit(self) -> int:
         """Obtiene el límite de velas históricas a solicitar."""
-        return self._get_config_int('data', 'limit', 200)
+        return self._settings.data_limit
     
     def get_log_level(self) -> str:
         """Obtiene el nivel de logging."""
-        return self._get_config_value('logging', 'level', 'INFO')
+        return self._settings.log_level
     
     def get_log_file(self) -> str:
         """Obtiene el archivo de log."""
-        return self._get_config_value('logging', 'file', 'logs/phoenix.log')
+        return self._settings.log_file
     
     def _get_env_var(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """
@@ -146,39 +226,37 @@ class ConfigManager:
         """
         return os.getenv(key, default)
     
-    def _get_config_value(self, section: str, key: str, default: str = "") -> str:
+    def _get_config_value(self, section: str, key: str) -> str:
         """
         Obtiene un valor de configuración.
         
         Args:
             section: Sección del archivo de configuración
             key: Clave de configuración
-            default: Valor por defecto
             
         Returns:
-            Valor de configuración
+            Valor de configuración, o el de _DEFAULTS si no está definido
         """
         try:
             return self._config.get(section, key)
         except (configparser.NoSectionError, configparser.NoOptionError):
-            return default
+            return _DEFAULTS[f"{section}.{key}"]
     
-    def _get_config_int(self, section: str, key: str, default: int = 0) -> int:
+    def _get_config_int(self, section: str, key: str) -> int:
         """
         Obtiene un valor entero de configuración.
         
         Args:
             section: Sección del archivo de configuración
             key: Clave de configuración
-            default: Valor por defecto
             
         Returns:
-            Valor entero de configuración
+            Valor entero de configuración, o el de _DEFAULTS si falta o no es válido
         """
         try:
             return self._config.getint(section, key)
         except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
-            return default
+            return _DEFAULTS[f"{section}.{key}"]
     
     def get_all_config(self) -> Dict[str, Any]:
         """
@@ -5,39 +5,39 @@ Excepciones personalizadas para el Proyecto Phoenix.
 
 class PhoenixError(Exception):
     """Excepción base para errores del Proyecto Phoenix."""
-    pass
+    __slots__ = ()
 
 
 class ExchangeConnectionError(PhoenixError):
     """Error de conexión con el exchange."""
-    pass
+    __slots__ = ()
 
 
 class DataValidationError(PhoenixError):
     """Error de validación de datos."""
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(PhoenixError):
     """Error de límite de velocidad del exchange."""
-    pass
+    __slots__ = ()
 
 
 class InsufficientDataError(PhoenixError):
     """Error por datos insuficientes para análisis."""
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(PhoenixError):
     """Error de configuración del sistema."""
-    pass
+    __slots__ = ()
 
 
 class AnalysisError(PhoenixError):
     """Error durante el análisis técnico o de señales."""
-    pass
+    __slots__ = ()
 
 
 class SignalDetectionError(PhoenixError):
     """Error específico durante la detección de señales de trading."""
-    pass
+    __slots__ = ()
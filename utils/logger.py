@@ -2,14 +2,36 @@
 Configuración del sistema de logging para el Proyecto Phoenix.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from typing import Optional
 
 from utils.config_manager import ConfigManager
 
 
+# Niveles admitidos en config.ini; cualquier otro valor se trata como INFO
+_LEVELS = {
+    name: getattr(logging, name)
+    for name in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+}
+
+# Logger principal ya configurado por setup_logging
+_PHOENIX_LOGGER: Optional[logging.Logger] = None
+
+
+def get_logger() -> logging.Logger:
+    """
+    Devuelve el logger principal del proyecto sin volver a configurarlo.
+    
+    Returns:
+        Logger configurado por setup_logging, o el logger 'phoenix' si aún no se llamó
+    """
+    return _PHOENIX_LOGGER or logging.getLogger('phoenix')
+
+
 def setup_logging(config_manager: ConfigManager) -> logging.Logger:
     """
     Configura el sistema de logging del proyecto.
@@ -20,14 +42,16 @@ def setup_logging(config_manager: ConfigManager) -> logging.Logger:
     Returns:
         Logger principal configurado
     """
+    global _PHOENIX_LOGGER
+    
     # Obtener configuración de logging
-    log_level = getattr(logging, config_manager.get_log_level().upper(), logging.INFO)
+    log_level = _LEVELS.get(config_manager.get_log_level().strip().upper(), logging.INFO)
     log_file = config_manager.get_log_file()
     
-    # Crear directorio de logs si no existe
+    # Crear directorio de logs si no existe (seguro ante arranques concurrentes)
     log_dir = os.path.dirname(log_file)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
     
     # Configurar el logger principal
     logger = logging.getLogger('phoenix')
@@ -35,6 +59,7 @@ def setup_logging(config_manager: ConfigManager) -> logging.Logger:
     
     # Evitar duplicar handlers
     if logger.handlers:
+        _PHOENIX_LOGGER = logger
         return logger
     
     # Formato de logging
@@ -51,12 +76,26 @@ def setup_logging(config_manager: ConfigManager) -> logging.Logger:
     )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
     
     # Handler para consola
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
     
+    # El logger solo encola los registros; un hilo en segundo plano los
+    # formatea y escribe en archivo y consola
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(log_level)
+    logger.addHandler(queue_handler)
+    
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    
+    # Vaciar la cola y cerrar los handlers al terminar el proceso
+    atexit.register(listener.stop)
+    
+    _PHOENIX_LOGGER = logger
     return logger